@@ -1,10 +1,32 @@
 """Metadata aggregator for combining results from multiple scrapers"""
 
+from functools import lru_cache
 from typing import Any, Optional
 
 from javinizer.models import MovieMetadata, Actress, ScraperPriority
 
 
+# Alias expansion: "dmm" matches both "dmm_new" (preferred) and "dmm"
+_PRIORITY_ALIASES = {
+    "dmm": ("dmm_new", "dmm"),  # dmm_new is preferred over dmm
+    "r18": ("r18dev",),
+    "jav": ("javlibrary",),
+}
+
+
+@lru_cache(maxsize=64)
+def _expand_priority(source_list: tuple[str, ...]) -> tuple[str, ...]:
+    """Expand source aliases in a priority list to actual scraper names.
+
+    Priority lists come from settings and rarely change, so the expansion
+    is cached per distinct list instead of being rebuilt for every field.
+    """
+    expanded: list[str] = []
+    for source in source_list:
+        expanded.extend(_PRIORITY_ALIASES.get(source, (source,)))
+    return tuple(expanded)
+
+
 def aggregate_metadata(
     results: dict[str, MovieMetadata],
     priority: Optional[ScraperPriority] = None,
@@ -26,32 +48,13 @@ def aggregate_metadata(
         priority = ScraperPriority()
 
     # Get first valid result as base
-    base_source = list(results.keys())[0]
+    base_source = next(iter(results))
     base = results[base_source]
 
-    # Alias expansion: "dmm" matches both "dmm_new" (preferred) and "dmm"
-    SCRAPER_ALIASES = {
-        "dmm": ["dmm_new", "dmm"],  # dmm_new is preferred over dmm
-        "r18": ["r18dev"],
-        "jav": ["javlibrary"],
-    }
-
-    def expand_sources(source_list: list[str]) -> list[str]:
-        """Expand source aliases to actual scraper names"""
-        expanded = []
-        for source in source_list:
-            if source in SCRAPER_ALIASES:
-                expanded.extend(SCRAPER_ALIASES[source])
-            else:
-                expanded.append(source)
-        return expanded
-
     # Helper function to get field by priority
     def get_field(field_name: str, priority_list: list[str]) -> Any:
         """Get field value from results based on priority order."""
-        # Expand aliases in priority list
-        expanded_priority = expand_sources(priority_list)
-        for source in expanded_priority:
+        for source in _expand_priority(tuple(priority_list)):
             if source in results:
                 value = getattr(results[source], field_name, None)
                 if value:
@@ -67,8 +70,7 @@ def aggregate_metadata(
     def merge_actresses() -> list[Actress]:
         all_actresses: dict[str, Actress] = {}
 
-        expanded_actress_priority = expand_sources(priority.actress)
-        for source in expanded_actress_priority:
+        for source in _expand_priority(tuple(priority.actress)):
             if source in results:
                 for actress in results[source].actresses:
                     key = actress.japanese_name or actress.full_name
@@ -87,16 +89,16 @@ def aggregate_metadata(
     # Merge genres from all sources (union)
     def merge_genres() -> list[str]:
         all_genres = set()
-        expanded_genre_priority = expand_sources(priority.genre)
-        for source in expanded_genre_priority:
+        for source in _expand_priority(tuple(priority.genre)):
             if source in results:
                 all_genres.update(results[source].genres)
         for result in results.values():
             all_genres.update(result.genres)
         return list(all_genres)
 
-    # Build aggregated metadata
-    aggregated = MovieMetadata(
+    # Build aggregated metadata; every value comes from a validated result.
+    # Lists are copied so the aggregate never shares one with a source.
+    aggregated = MovieMetadata.from_validated(
         id=get_field("id", priority.title) or base.id,
         content_id=get_field("content_id", priority.title),
         title=get_field("title", priority.title) or base.title,
@@ -113,7 +115,7 @@ def aggregate_metadata(
         tags=list(set(tag for r in results.values() for tag in r.tags)),
         rating=get_field("rating", priority.title),
         cover_url=get_field("cover_url", priority.cover_url),
-        screenshot_urls=get_field("screenshot_urls", priority.cover_url) or [],
+        screenshot_urls=list(get_field("screenshot_urls", priority.cover_url) or []),
         trailer_url=get_field("trailer_url", priority.cover_url),
         source="aggregated",
     )
@@ -132,7 +134,7 @@ def merge_two(primary: MovieMetadata, secondary: MovieMetadata) -> MovieMetadata
     Returns:
         Merged MovieMetadata
     """
-    return MovieMetadata(
+    return MovieMetadata.from_validated(
         id=primary.id or secondary.id,
         content_id=primary.content_id or secondary.content_id,
         title=primary.title or secondary.title,
@@ -144,12 +146,12 @@ def merge_two(primary: MovieMetadata, secondary: MovieMetadata) -> MovieMetadata
         maker=primary.maker or secondary.maker,
         label=primary.label or secondary.label,
         series=primary.series or secondary.series,
-        actresses=primary.actresses if primary.actresses else secondary.actresses,
+        actresses=list(primary.actresses or secondary.actresses),
         genres=list(set(primary.genres + secondary.genres)),
         tags=list(set(primary.tags + secondary.tags)),
         rating=primary.rating or secondary.rating,
         cover_url=primary.cover_url or secondary.cover_url,
-        screenshot_urls=primary.screenshot_urls or secondary.screenshot_urls,
+        screenshot_urls=list(primary.screenshot_urls or secondary.screenshot_urls),
         trailer_url=primary.trailer_url or secondary.trailer_url,
         source=f"{primary.source}+{secondary.source}",
     )
@@ -2,12 +2,13 @@
 """SQLite-based metadata cache for scraped data"""
 
 import json
+import re
 import sqlite3
 import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from contextlib import contextmanager
 
 from javinizer.models import MovieMetadata
@@ -18,22 +19,37 @@ logger = get_logger(__name__)
 # Cache schema version for migrations
 SCHEMA_VERSION = 1
 
+# SQLite's special filename for a database that lives only in memory
+MEMORY_DB_PATH = ":memory:"
+
+_PRAGMA_TOKEN = re.compile(r"^-?\w+$")
+
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO metadata_cache
+    (movie_id, source, data_json, data_hash, created_at, expires_at, hit_count)
+    VALUES (?, ?, ?, ?, ?, ?, 0)
+"""
+
 
 @dataclass
 class CacheConfig:
     """Configuration for metadata cache.
 
     Attributes:
-        db_path: Path to SQLite database file
+        db_path: Path to SQLite database file, or ":memory:" for a
+            private in-memory database
         ttl_days: Time-to-live for cached entries in days
         enabled: Whether caching is enabled
         max_entries: Maximum number of entries (0 = unlimited)
+        pragmas: SQLite PRAGMA settings applied when the connection opens,
+            e.g. {"journal_mode": "WAL", "synchronous": "NORMAL"}
     """
 
     db_path: Path = field(default_factory=lambda: Path("cache/metadata.db"))
     ttl_days: int = 30
     enabled: bool = True
     max_entries: int = 0  # 0 = unlimited
+    pragmas: dict[str, str] = field(default_factory=dict)
 
 
 class CacheManager:
@@ -66,14 +82,19 @@ class CacheManager:
 
     def _init_db(self) -> None:
         """Initialize SQLite database with schema."""
+        # Reject bad pragmas before opening anything that would need closing
+        self._validate_pragmas()
+
         # Ensure parent directory exists
-        self.config.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if str(self.config.db_path) != MEMORY_DB_PATH:
+            self.config.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._conn = sqlite3.connect(
             str(self.config.db_path),
             check_same_thread=False,  # Allow multi-thread access
         )
         self._conn.row_factory = sqlite3.Row
+        self._apply_pragmas(self._conn)
 
         # Create tables
         self._conn.executescript("""
@@ -111,6 +132,22 @@ class CacheManager:
         self._conn.commit()
         logger.debug(f"Cache initialized at {self.config.db_path}")
 
+    def _validate_pragmas(self) -> None:
+        """Check configured PRAGMA settings are safe to interpolate.
+
+        Raises:
+            ValueError: If a pragma name or value is not a plain token
+        """
+        for name, value in self.config.pragmas.items():
+            # PRAGMA doesn't accept bound parameters, so only allow plain tokens
+            if not _PRAGMA_TOKEN.match(name) or not _PRAGMA_TOKEN.match(str(value)):
+                raise ValueError(f"Invalid cache pragma: {name}={value}")
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply the validated PRAGMA settings to a freshly opened connection."""
+        for name, value in self.config.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
     @contextmanager
     def _transaction(self):
         """Context manager for database transactions."""
@@ -197,42 +234,76 @@ class CacheManager:
         if not self.config.enabled or not self._conn:
             return False
 
-        movie_id = movie_id.upper()
-        ttl = ttl_days or self.config.ttl_days
-
         now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(days=ttl)
-
-        data_json = metadata.model_dump_json()
-        data_hash = self._compute_hash(data_json)
+        row = self._make_row(movie_id, source, metadata, now, ttl_days)
 
         try:
             with self._transaction():
-                self._conn.execute(
-                    """
-                    INSERT OR REPLACE INTO metadata_cache
-                    (movie_id, source, data_json, data_hash, created_at, expires_at, hit_count)
-                    VALUES (?, ?, ?, ?, ?, ?, 0)
-                """,
-                    (
-                        movie_id,
-                        source,
-                        data_json,
-                        data_hash,
-                        now.isoformat(),
-                        expires_at.isoformat(),
-                    ),
-                )
-
-            logger.debug(
-                f"Cached: {movie_id} from {source} (expires: {expires_at.date()})"
-            )
+                self._conn.execute(_INSERT_SQL, row)
+
+            logger.debug(f"Cached: {row[0]} from {source} (expires: {row[5]})")
             return True
 
         except Exception as e:
             logger.error(f"Failed to cache metadata: {e}")
             return False
 
+    def set_many(
+        self,
+        entries: Iterable[tuple[str, str, MovieMetadata]],
+        ttl_days: Optional[int] = None,
+    ) -> int:
+        """Store several metadata entries in a single transaction.
+
+        Args:
+            entries: (movie_id, source, metadata) tuples
+            ttl_days: Override TTL for these entries
+
+        Returns:
+            Number of entries stored (0 if the batch failed)
+        """
+        if not self.config.enabled or not self._conn:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            self._make_row(movie_id, source, metadata, now, ttl_days)
+            for movie_id, source, metadata in entries
+        ]
+
+        try:
+            with self._transaction():
+                self._conn.executemany(_INSERT_SQL, rows)
+
+            logger.debug(f"Cached {len(rows)} entries in one transaction")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to cache metadata batch: {e}")
+            return 0
+
+    def _make_row(
+        self,
+        movie_id: str,
+        source: str,
+        metadata: MovieMetadata,
+        now: datetime,
+        ttl_days: Optional[int],
+    ) -> tuple[str, str, str, str, str, str]:
+        """Build the INSERT parameters for one cache entry."""
+        ttl = ttl_days or self.config.ttl_days
+        expires_at = now + timedelta(days=ttl)
+
+        data_json = metadata.model_dump_json()
+        return (
+            movie_id.upper(),
+            source,
+            data_json,
+            self._compute_hash(data_json),
+            now.isoformat(),
+            expires_at.isoformat(),
+        )
+
     def invalidate(self, movie_id: str, source: Optional[str] = None) -> int:
         """Invalidate cached entries.
 
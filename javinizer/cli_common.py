@@ -1,9 +1,10 @@
 """Shared CLI utilities and constants"""
 
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
 from rich.console import Console
 
-from javinizer.models import ProxyConfig
+from javinizer.models import MovieMetadata, ProxyConfig
 from javinizer.scrapers import (
     DMMScraper,
     R18DevScraper,
@@ -80,9 +81,9 @@ def scrape_parallel(
     sources: list[str],
     proxy_config: Optional[ProxyConfig],
     settings,
-    console: Console,
+    console: Optional[Console],
     max_workers: int = 4,
-) -> dict[str, Any]:
+) -> dict[str, MovieMetadata]:
     """
     Run scrapers in parallel and collect results.
 
@@ -91,14 +92,14 @@ def scrape_parallel(
         sources: List of source names (already expanded)
         proxy_config: Proxy configuration
         settings: Application settings object
-        console: Console for output
+        console: Console for output, or None to run without progress output
         max_workers: Max parallel threads (default: 4)
 
     Returns:
         Dict mapping source name to MovieMetadata
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    from javinizer.models import MovieMetadata
+    if console is None:
+        console = Console(quiet=True)
 
     results: dict[str, MovieMetadata] = {}
 
@@ -5,7 +5,8 @@ import asyncio
 from rich.console import Console
 
 from javinizer.models import MovieMetadata, Settings
-from javinizer.thumbs import ActressDB
+from javinizer.thumbs import get_actress_db
+from javinizer.translator import Translator, translate_metadata
 
 
 console = Console()
@@ -21,7 +22,8 @@ def process_thumbnails(metadata: MovieMetadata, settings: Settings) -> None:
 
     console.print("[dim]Processing thumbnails...[/]", end=" ")
     try:
-        db = ActressDB()
+        # Shared across movies so a batch sort reads the actress CSV only once
+        db = get_actress_db()
         asyncio.run(db.process_metadata(metadata))
         console.print("[green]OK[/]")
     except Exception as e:
@@ -38,8 +40,6 @@ def translate_metadata_if_enabled(metadata: MovieMetadata, settings: Settings) -
 
     console.print("[dim]Translating...[/]", end=" ")
     try:
-        from javinizer.translator import Translator, translate_metadata
-
         translator = Translator(
             provider=settings.translation.provider,
             target_language=settings.translation.target_language,
@@ -157,13 +157,13 @@ def config_get_javlibrary_cookies(proxy: Optional[str], timeout: int):
         console.print("[cyan]   Navigating to Javlibrary...[/]")
         driver.get("https://www.javlibrary.com/en/")
 
-        start_time = time.time()
+        start_time = time.monotonic()
         cf_clearance = None
         user_agent = driver.execute_script("return navigator.userAgent;")
 
         console.print("[yellow]   Waiting for Cloudflare challenge to be solved...[/]")
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             cookies = driver.get_cookies()
             for cookie in cookies:
                 if cookie["name"] == "cf_clearance":
@@ -9,7 +9,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-from javinizer.cli_common import console, expand_sources
+from javinizer.cli_common import console, expand_sources, scrape_parallel
 from javinizer.models import MovieMetadata, ProxyConfig
 from javinizer.config import load_settings
 from javinizer.aggregator import aggregate_metadata
@@ -124,8 +124,6 @@ def find(
         console.print()
 
         # Scrape from all sources
-        from javinizer.cli_common import scrape_parallel
-
         results = scrape_parallel(movie_id, sources, proxy_config, settings, console)
 
         if not results:
@@ -140,7 +138,7 @@ def find(
         console.print(f"[green]📦 Aggregated from {len(results)} sources[/]")
     else:
         # Use first available result
-        metadata = list(results.values())[0]
+        metadata = next(iter(results.values()))
 
     if metadata is None:
         console.print("[yellow]⚠️  Could not aggregate metadata[/]")
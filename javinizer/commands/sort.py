@@ -6,10 +6,11 @@ from pathlib import Path
 
 import click
 
-from javinizer.cli_common import console, expand_sources
-from javinizer.models import ProxyConfig
+from javinizer.aggregator import aggregate_metadata
+from javinizer.cli_common import console, expand_sources, scrape_parallel
+from javinizer.models import ProxyConfig, Settings, SortSettings
 from javinizer.config import load_settings
-from javinizer.matcher import extract_movie_id, find_video_files
+from javinizer.matcher import extract_movie_id, extract_movie_ids, find_video_files
 from javinizer.sorter import SortConfig, generate_sort_paths, execute_sort
 from javinizer.downloader import ImageDownloader
 from javinizer.nfo import generate_nfo
@@ -68,10 +69,61 @@ def sort(
         console.print("[dim]Expected format: ABC-123, SSNI-486, etc.[/]")
         return
 
-    console.print(f"[cyan]Movie ID:[/] {movie_id}")
-
-    # Load settings
     settings = load_settings()
+    _sort_video(
+        video_path,
+        movie_id,
+        dest_path,
+        source,
+        proxy,
+        settings,
+        _build_sort_config(settings.sort),
+        dry_run=dry_run,
+        copy=copy,
+    )
+
+
+def _build_sort_config(sort_settings: SortSettings) -> SortConfig:
+    """Build the sorter configuration from the user's sort settings.
+
+    Args:
+        sort_settings: Sort section of the loaded settings
+
+    Returns:
+        SortConfig for generate_sort_paths
+    """
+    return SortConfig(
+        folder_format=sort_settings.folder_format,
+        file_format=sort_settings.file_format,
+        nfo_format=sort_settings.nfo_format,
+        poster_filename=sort_settings.poster_filename,
+        backdrop_filename=sort_settings.backdrop_filename,
+        max_title_length=sort_settings.max_title_length,
+        move_to_folder=True,
+        rename_file=True,
+        create_nfo=sort_settings.create_nfo,
+        download_images=sort_settings.download_images,
+        move_subtitles=sort_settings.move_subtitles,
+    )
+
+
+def _sort_video(
+    video_path: Path,
+    movie_id: str,
+    dest_path: Path,
+    source: str,
+    proxy: Optional[str],
+    settings: Settings,
+    config: SortConfig,
+    dry_run: bool,
+    copy: bool,
+) -> None:
+    """Scrape metadata for one video and sort it into dest_path.
+
+    The caller extracts movie_id from the filename, so sort-dir can parse
+    all names in one batch without each file being parsed again here.
+    """
+    console.print(f"[cyan]Movie ID:[/] {movie_id}")
 
     # Setup proxy
     proxy_config = None
@@ -82,10 +134,6 @@ def sort(
 
     # Fetch metadata - expand aliases (dmm -> [dmm_new, dmm])
     sources = expand_sources([s.strip() for s in source.split(",")])
-    results = {}
-
-    from javinizer.cli_common import scrape_parallel
-
     results = scrape_parallel(movie_id, sources, proxy_config, settings, console)
 
     if not results:
@@ -94,32 +142,14 @@ def sort(
 
     # Aggregate results if multiple sources found
     if len(results) > 1:
-        from javinizer.aggregator import aggregate_metadata
-
         metadata = aggregate_metadata(results, settings.priority)
         console.print(f"[green]📦 Aggregated from {len(results)} sources[/]")
     else:
         # Use first available result
-        metadata = list(results.values())[0]
+        metadata = next(iter(results.values()))
 
     console.print(f"[green]Found:[/] {metadata.title}")
 
-    # Setup sort config from settings
-    sort_settings = settings.sort
-    config = SortConfig(
-        folder_format=sort_settings.folder_format,
-        file_format=sort_settings.file_format,
-        nfo_format=sort_settings.nfo_format,
-        poster_filename=sort_settings.poster_filename,
-        backdrop_filename=sort_settings.backdrop_filename,
-        max_title_length=sort_settings.max_title_length,
-        move_to_folder=True,
-        rename_file=True,
-        create_nfo=sort_settings.create_nfo,
-        download_images=sort_settings.download_images,
-        move_subtitles=sort_settings.move_subtitles,
-    )
-
     # Generate paths
     paths = generate_sort_paths(video_path, dest_path, metadata, config)
 
@@ -190,7 +220,7 @@ def sort(
             metadata,
             poster_filename=config.poster_filename,
             backdrop_filename=config.backdrop_filename,
-            use_japanese_names=sort_settings.actress_language_ja,
+            use_japanese_names=settings.sort.actress_language_ja,
         )
         paths.nfo_path.write_text(nfo_content, encoding="utf-8")
         console.print("[green]NFO created[/]")
@@ -238,44 +268,57 @@ def sort_dir(
     console.print(f"[cyan]Found {len(videos)} video files[/]")
     console.print()
 
+    # Settings and sort config are the same for every video in the batch
+    settings = load_settings()
+    config = _build_sort_config(settings.sort)
+    dest_path = Path(dest)
+
     # Process each video
     success_count = 0
     skip_count = 0
     error_count = 0
+    cancelled_count = 0
+    cancelled = False
 
-    for video in videos:
-        movie_id = extract_movie_id(video.name)
+    movie_ids = extract_movie_ids(video.name for video in videos)
 
-        if not movie_id:
-            console.print(f"[yellow]Skip:[/] {video.name} (no ID found)")
-            skip_count += 1
-            continue
+    try:
+        for video, movie_id in zip(videos, movie_ids):
+            if not movie_id:
+                console.print(f"[yellow]Skip:[/] {video.name} (no ID found)")
+                skip_count += 1
+                continue
 
-        console.print(f"[cyan]Processing:[/] {video.name} -> {movie_id}")
+            console.print(f"[cyan]Processing:[/] {video.name} -> {movie_id}")
 
-        if dry_run:
-            console.print(f"  [dim]Would sort to: {dest}/{movie_id}...[/]")
-            success_count += 1
-        else:
-            # Call sort_file programmatically
-            try:
-                # Use click context to invoke sort command
-                ctx = click.Context(sort)
-                ctx.invoke(
-                    sort,
-                    video_file=str(video),
-                    dest=dest,
-                    source=source,
-                    proxy=proxy,
-                    dry_run=False,
-                    copy=copy,
-                )
+            if dry_run:
+                console.print(f"  [dim]Would sort to: {dest}/{movie_id}...[/]")
                 success_count += 1
-            except Exception as e:
-                console.print(f"  [red]Error: {e}[/]")
-                error_count += 1
+            else:
+                try:
+                    _sort_video(
+                        video,
+                        movie_id,
+                        dest_path,
+                        source,
+                        proxy,
+                        settings,
+                        config,
+                        dry_run=False,
+                        copy=copy,
+                    )
+                    success_count += 1
+                except Exception as e:
+                    console.print(f"  [red]Error: {e}[/]")
+                    error_count += 1
 
+            console.print()
+    except KeyboardInterrupt:
+        # Stop the batch cleanly so the summary still reflects completed work
+        cancelled = True
+        cancelled_count = len(videos) - success_count - skip_count - error_count
         console.print()
+        console.print("[yellow]Cancelled, remaining videos were not processed[/]")
 
     # Summary
     console.print()
@@ -283,3 +326,9 @@ def sort_dir(
     console.print(f"  Processed: {success_count}")
     console.print(f"  Skipped:   {skip_count}")
     console.print(f"  Errors:    {error_count}")
+    if cancelled_count:
+        console.print(f"  Cancelled: {cancelled_count}")
+
+    if cancelled:
+        # Exit non-zero so chained commands don't run after the user aborts
+        raise click.Abort()
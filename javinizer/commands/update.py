@@ -6,6 +6,7 @@ from pathlib import Path
 
 import click
 
+from javinizer.aggregator import aggregate_metadata
 from javinizer.cli_common import console, expand_sources, get_scraper
 from javinizer.models import ProxyConfig
 from javinizer.config import load_settings
@@ -101,12 +102,10 @@ def update(
 
     # Aggregate results if multiple sources found
     if len(results) > 1:
-        from javinizer.aggregator import aggregate_metadata
-
         metadata = aggregate_metadata(results, settings.priority)
         console.print(f"[green]📦 Aggregated from {len(results)} sources[/]")
     else:
-        metadata = list(results.values())[0]
+        metadata = next(iter(results.values()))
 
     console.print(f"[green]Found:[/] {metadata.title}")
 
@@ -14,8 +14,9 @@ If Replacement is empty, the Original will be filtered out.
 """
 
 import csv
+import io
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, TypeVar, cast
 
 from javinizer.logger import get_logger
 
@@ -33,6 +34,8 @@ class CSVMapper:
         """
         self.mappings: dict[str, str] = {}
         self.filters: set[str] = set()  # Items to filter out (empty replacement)
+        # Combined lowercase lookup used by map(): replacement, or None if filtered
+        self._lookup: dict[str, Optional[str]] = {}
         self._loaded = False
         self._csv_path = csv_path
 
@@ -49,26 +52,9 @@ class CSVMapper:
             True if loaded successfully
         """
         try:
-            with open(csv_path, "r", encoding="utf-8-sig") as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    # Skip empty rows and comments
-                    if not row or row[0].startswith("#"):
-                        continue
-                    
-                    original = row[0].strip()
-                    if not original:
-                        continue
-                        
-                    replacement = row[1].strip() if len(row) > 1 else ""
-                    
-                    if replacement:
-                        self.mappings[original.lower()] = replacement
-                    else:
-                        # Empty replacement = filter out
-                        self.filters.add(original.lower())
-
-            self._loaded = True
+            with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+                self._load_rows(csv.reader(f))
+
             logger.debug(f"Loaded {len(self.mappings)} mappings, {len(self.filters)} filters from {csv_path}")
             return True
             
@@ -76,6 +62,46 @@ class CSVMapper:
             logger.warning(f"Failed to load CSV {csv_path}: {e}")
             return False
 
+    @classmethod
+    def from_string(cls, text: str) -> "CSVMapper":
+        """Create a mapper from CSV text instead of a file
+        
+        Args:
+            text: CSV content in the same format as the mapping files
+            
+        Returns:
+            Loaded mapper instance
+        """
+        mapper = cls()
+        mapper._load_rows(csv.reader(io.StringIO(text, newline="")))
+        return mapper
+
+    def _load_rows(self, rows: Iterable[list[str]]) -> None:
+        """Add mappings and filters from parsed CSV rows"""
+        for row in rows:
+            # Skip empty rows and comments
+            if not row or row[0].startswith("#"):
+                continue
+            
+            original = row[0].strip()
+            if not original:
+                continue
+                
+            replacement = row[1].strip() if len(row) > 1 else ""
+            
+            key = original.lower()
+            if replacement:
+                self.mappings[key] = replacement
+                # Filters take precedence over mappings for the same name
+                if key not in self.filters:
+                    self._lookup[key] = replacement
+            else:
+                # Empty replacement = filter out
+                self.filters.add(key)
+                self._lookup[key] = None
+
+        self._loaded = True
+
     def map(self, name: str) -> Optional[str]:
         """Map a name to its replacement
         
@@ -85,18 +111,7 @@ class CSVMapper:
         Returns:
             Mapped name, original if no mapping, or None if filtered
         """
-        name_lower = name.lower().strip()
-        
-        # Check if filtered
-        if name_lower in self.filters:
-            return None
-            
-        # Check if mapped
-        if name_lower in self.mappings:
-            return self.mappings[name_lower]
-            
-        # Return original
-        return name
+        return self._lookup.get(name.lower().strip(), name)
 
     def map_list(self, names: list[str]) -> list[str]:
         """Map a list of names, filtering out None results
@@ -107,9 +122,10 @@ class CSVMapper:
         Returns:
             List of mapped names (filtered items removed)
         """
+        lookup = self._lookup
         result = []
         for name in names:
-            mapped = self.map(name)
+            mapped = lookup.get(name.lower().strip(), name)
             if mapped is not None:
                 result.append(mapped)
         return result
@@ -134,6 +150,38 @@ class StudioMapper(CSVMapper):
 _genre_mapper: Optional[GenreMapper] = None
 _studio_mapper: Optional[StudioMapper] = None
 
+_M = TypeVar("_M", bound=CSVMapper)
+
+
+# Parsed mappers by (mapper class, path), with the file version they were
+# parsed from: (mtime_ns, size, mapper)
+_mapper_cache: dict[tuple[type[CSVMapper], str], tuple[int, int, CSVMapper]] = {}
+
+
+def _get_cached_mapper(mapper_cls: type[_M], csv_path: Path) -> _M:
+    """Get a mapper for csv_path, re-parsing only when the file changes
+
+    The file version is its mtime plus its size, so a rewrite that lands
+    within the filesystem's mtime granularity is still noticed when the
+    length changes. Every caller for the same file version gets the same
+    mapper instance, so it must be treated as read-only.
+    """
+    try:
+        stat = csv_path.stat()
+    except OSError:
+        # Missing file: nothing to parse or cache
+        return mapper_cls(csv_path)
+
+    key = (mapper_cls, str(csv_path))
+    cached = _mapper_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        # Stored under mapper_cls, so it is an _M
+        return cast(_M, cached[2])
+
+    mapper = mapper_cls(csv_path)
+    _mapper_cache[key] = (stat.st_mtime_ns, stat.st_size, mapper)
+    return mapper
+
 
 def get_genre_mapper(csv_path: Optional[Path] = None) -> GenreMapper:
     """Get or create the global genre mapper
@@ -145,8 +193,10 @@ def get_genre_mapper(csv_path: Optional[Path] = None) -> GenreMapper:
         GenreMapper instance
     """
     global _genre_mapper
-    if _genre_mapper is None or csv_path:
-        _genre_mapper = GenreMapper(csv_path)
+    if csv_path:
+        _genre_mapper = _get_cached_mapper(GenreMapper, csv_path)
+    elif _genre_mapper is None:
+        _genre_mapper = GenreMapper()
     return _genre_mapper
 
 
@@ -160,8 +210,10 @@ def get_studio_mapper(csv_path: Optional[Path] = None) -> StudioMapper:
         StudioMapper instance
     """
     global _studio_mapper
-    if _studio_mapper is None or csv_path:
-        _studio_mapper = StudioMapper(csv_path)
+    if csv_path:
+        _studio_mapper = _get_cached_mapper(StudioMapper, csv_path)
+    elif _studio_mapper is None:
+        _studio_mapper = StudioMapper()
     return _studio_mapper
 
 
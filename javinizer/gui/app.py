@@ -1,10 +1,12 @@
 """FastAPI application for Javinizer GUI"""
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 
 try:
     from fastapi import FastAPI, Request, HTTPException
+    from fastapi.middleware.gzip import GZipMiddleware
     from fastapi.responses import HTMLResponse, JSONResponse
     from fastapi.templating import Jinja2Templates
     import uvicorn
@@ -13,8 +15,11 @@ except ImportError:
     HAS_FASTAPI = False
     FastAPI = None
 
+from javinizer.aggregator import aggregate_metadata
+from javinizer.cli_common import expand_sources, scrape_parallel
 from javinizer.config import load_settings, save_settings
 from javinizer.logger import get_logger
+from javinizer.models import MovieMetadata
 
 logger = get_logger(__name__)
 
@@ -35,9 +40,18 @@ def create_app() -> "FastAPI":
         version="0.1.0",
     )
 
+    # Rendered pages are highly compressible; tiny JSON replies stay as-is
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
     # Setup templates
     templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
 
+    # In-flight /api/find scrapes keyed by (movie ID, sources) so that
+    # concurrent requests for the same movie share one upstream scrape
+    inflight: dict[
+        tuple[str, tuple[str, ...]], asyncio.Future[dict[str, MovieMetadata]]
+    ] = {}
+
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request):
         """Home page with search and overview"""
@@ -101,25 +115,37 @@ def create_app() -> "FastAPI":
                 status_code=400,
             )
 
-    @app.get("/api/find/{movie_id}")
+    @app.get("/api/find/{movie_id}", response_class=JSONResponse)
     async def api_find(movie_id: str, source: Optional[str] = None):
         """API endpoint to find movie metadata"""
-        from javinizer.cli_common import expand_sources, scrape_parallel
-        from javinizer.aggregator import aggregate_metadata
-
         settings = load_settings()
         sources = expand_sources(
             source.split(",") if source else ["r18dev", "dmm"]
         )
         proxy_config = settings.proxy
 
-        results = scrape_parallel(movie_id, sources, proxy_config, settings, None)
+        # Normalize once so the shared scrape uses the same ID as the key
+        movie_id = movie_id.strip().upper()
+        key = (movie_id, tuple(sources))
+        future = inflight.get(key)
+        if future is None:
+            # Scrapers are blocking, keep them off the event loop
+            future = asyncio.get_running_loop().run_in_executor(
+                None, scrape_parallel, movie_id, sources, proxy_config, settings, None
+            )
+            inflight[key] = future
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+
+        # Shield so one disconnecting client doesn't cancel the shared scrape
+        results = await asyncio.shield(future)
 
         if not results:
             raise HTTPException(status_code=404, detail="Movie not found")
 
         metadata = aggregate_metadata(results, settings.priority)
-        return metadata.model_dump(mode="json")
+        # model_dump(mode="json") is already serializable; returning the
+        # response directly skips FastAPI's jsonable_encoder pass
+        return JSONResponse(metadata.model_dump(mode="json"))
 
     @app.get("/api/health")
     async def health():
@@ -42,7 +42,7 @@ def check_scraper_health(
         HealthCheckResult with status and latency
     """
     name = getattr(scraper_class, "name", scraper_class.__name__)
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         with scraper_class(timeout=timeout) as scraper:
@@ -51,7 +51,7 @@ def check_scraper_health(
 
             # Try to reach the base URL
             response = scraper.client.head(scraper.base_url, timeout=timeout)
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
             if response.status_code < 400:
                 return HealthCheckResult(
@@ -77,7 +77,7 @@ def check_scraper_health(
                 )
 
     except TimeoutError:
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter() - start_time) * 1000
         return HealthCheckResult(
             name=name,
             status="timeout",
@@ -85,7 +85,7 @@ def check_scraper_health(
             message=f"Timeout after {timeout}s",
         )
     except Exception as e:
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter() - start_time) * 1000
         return HealthCheckResult(
             name=name, status="error", latency_ms=latency_ms, message=str(e)
         )
@@ -139,7 +139,7 @@ def check_cache_health() -> HealthCheckResult:
         from javinizer.cache import CacheManager, CacheConfig
         from pathlib import Path
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Try to create a temporary cache
         cache = CacheManager(
@@ -152,7 +152,7 @@ def check_cache_health() -> HealthCheckResult:
         stats = cache.get_stats()
         cache.close()
 
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter() - start_time) * 1000
 
         return HealthCheckResult(
             name="cache",
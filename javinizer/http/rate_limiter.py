@@ -3,14 +3,44 @@
 
 import time
 import threading
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urlparse
 
 from javinizer.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _extract_host(url: str) -> str:
+    """Slice the lowercased host out of a URL.
+
+    Runs on every request, so this avoids a full urllib.parse pass: the
+    host is whatever sits between "://" and the first "/", "?" or "#",
+    minus any userinfo and port. IPv6 literals lose their brackets.
+
+    Args:
+        url: Full URL string
+
+    Returns:
+        Host portion of the URL (e.g., "www.dmm.co.jp")
+    """
+    scheme_end = url.find("://")
+    start = scheme_end + 3 if scheme_end != -1 else 0
+    end = len(url)
+    for sep in "/?#":
+        pos = url.find(sep, start, end)
+        if pos != -1:
+            end = pos
+
+    host = url[start:end].rpartition("@")[2]
+    if host.startswith("["):
+        host = host[1:host.find("]")]
+    else:
+        host = host.partition(":")[0]
+    return host.lower()
+
+
 class DomainRateLimiter:
     """Thread-safe per-domain rate limiter.
 
@@ -40,7 +70,11 @@ class DomainRateLimiter:
         """
         self.default_delay = default_delay
         self.domain_delays = domain_delays or {}
-        self._last_request: dict[str, float] = {}
+        # Monotonic timestamps (ns) of the last request per domain
+        self._last_request: dict[str, int] = {}
+        # One lock per domain so waiting on a slow domain never blocks others;
+        # _lock only guards creation of those locks
+        self._domain_locks: dict[str, threading.Lock] = {}
         self._lock = threading.Lock()
 
     def _extract_domain(self, url: str) -> str:
@@ -52,8 +86,22 @@ class DomainRateLimiter:
         Returns:
             Domain portion of URL (e.g., "www.dmm.co.jp")
         """
-        parsed = urlparse(url)
-        return parsed.netloc.lower()
+        return _extract_host(url)
+
+    def _get_domain_lock(self, domain: str) -> threading.Lock:
+        """Get the lock serializing requests to a domain, creating it once.
+
+        Args:
+            domain: Domain string
+
+        Returns:
+            Lock dedicated to this domain
+        """
+        lock = self._domain_locks.get(domain)
+        if lock is None:
+            with self._lock:
+                lock = self._domain_locks.setdefault(domain, threading.Lock())
+        return lock
 
     def _get_delay(self, domain: str) -> float:
         """Get configured delay for a domain.
@@ -70,7 +118,8 @@ class DomainRateLimiter:
         """Acquire permission to make a request, blocking if needed.
 
         Thread-safe. Will block the calling thread if a request was made
-        to the same domain too recently.
+        to the same domain too recently; requests to other domains are not
+        held up while it waits.
 
         Args:
             url: URL about to be requested
@@ -81,18 +130,17 @@ class DomainRateLimiter:
         domain = self._extract_domain(url)
         delay = self._get_delay(domain)
 
-        with self._lock:
-            now = time.time()
-            last = self._last_request.get(domain, 0)
-            elapsed = now - last
-
+        with self._get_domain_lock(domain):
             wait_time = 0.0
-            if elapsed < delay:
-                wait_time = delay - elapsed
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
-                time.sleep(wait_time)
-
-            self._last_request[domain] = time.time()
+            last = self._last_request.get(domain)
+            if last is not None:
+                wait_ns = last + int(delay * 1e9) - time.monotonic_ns()
+                if wait_ns > 0:
+                    wait_time = wait_ns / 1e9
+                    logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for {domain}")
+                    time.sleep(wait_time)
+
+            self._last_request[domain] = time.monotonic_ns()
             return wait_time
 
     def reset(self, domain: Optional[str] = None) -> None:
@@ -101,11 +149,10 @@ class DomainRateLimiter:
         Args:
             domain: Specific domain to reset, or None to reset all
         """
-        with self._lock:
-            if domain:
-                self._last_request.pop(domain, None)
-            else:
-                self._last_request.clear()
+        if domain:
+            self._last_request.pop(domain, None)
+        else:
+            self._last_request.clear()
 
     def set_delay(self, domain: str, delay: float) -> None:
         """Set custom delay for a specific domain.
@@ -12,6 +12,7 @@ logger = get_logger(__name__)
 
 # Default retryable HTTP status codes
 DEFAULT_RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+_DEFAULT_RETRYABLE_CODES = frozenset(DEFAULT_RETRYABLE_STATUS_CODES)
 
 
 @dataclass
@@ -25,6 +26,9 @@ class RetryConfig:
         exponential_base: Base for exponential backoff calculation
         retryable_status_codes: HTTP status codes that trigger retry
         jitter_enabled: Whether to add random jitter (disabled by default for determinism)
+
+    Backoff delays and the status code set are precomputed at construction,
+    so treat instances as read-only once created.
     """
 
     max_retries: int = 3
@@ -35,6 +39,19 @@ class RetryConfig:
         default_factory=lambda: DEFAULT_RETRYABLE_STATUS_CODES.copy()
     )
     jitter_enabled: bool = False  # Disabled for determinism
+    _delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _retryable_codes: frozenset[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # One entry per attempt that can sleep, plus the one after it
+        self._delays = tuple(
+            self._compute_delay(attempt) for attempt in range(self.max_retries + 1)
+        )
+        self._retryable_codes = frozenset(self.retryable_status_codes)
+
+    def _compute_delay(self, attempt: int) -> float:
+        delay = self.initial_delay * (self.exponential_base**attempt)
+        return min(delay, self.max_delay)
 
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay for a given retry attempt.
@@ -45,8 +62,9 @@ class RetryConfig:
         Returns:
             Delay in seconds before next retry
         """
-        delay = self.initial_delay * (self.exponential_base**attempt)
-        return min(delay, self.max_delay)
+        if 0 <= attempt < len(self._delays):
+            return self._delays[attempt]
+        return self._compute_delay(attempt)
 
 
 class RetryableError(Exception):
@@ -84,35 +102,26 @@ def with_retry(
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_exception: Optional[Exception] = None
-
+            # Only RetryableError is caught; anything else propagates at once
             for attempt in range(config.max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except RetryableError as e:
-                    last_exception = e
-                    if attempt < config.max_retries:
-                        delay = config.calculate_delay(attempt)
-                        logger.warning(
-                            f"Retry {attempt + 1}/{config.max_retries} for {func.__name__} "
-                            f"after {delay:.1f}s (status={e.status_code})"
-                        )
-                        if on_retry:
-                            on_retry(attempt, e, delay)
-                        time.sleep(delay)
-                    else:
+                    if attempt >= config.max_retries:
                         logger.error(
                             f"Max retries ({config.max_retries}) exceeded for {func.__name__}"
                         )
-                except Exception:
-                    # Non-retryable exception, raise immediately
-                    raise
-
-            # If we exhausted retries, raise the last exception
-            if last_exception:
-                raise last_exception
-
-            # Should never reach here, but satisfy type checker
+                        raise
+                    delay = config.calculate_delay(attempt)
+                    logger.warning(
+                        f"Retry {attempt + 1}/{config.max_retries} for {func.__name__} "
+                        f"after {delay:.1f}s (status={e.status_code})"
+                    )
+                    if on_retry:
+                        on_retry(attempt, e, delay)
+                    time.sleep(delay)
+
+            # Only reachable with a negative max_retries
             raise RuntimeError("Unexpected retry loop exit")
 
         return wrapper
@@ -130,6 +139,5 @@ def is_retryable_status(status_code: int, config: Optional[RetryConfig] = None)
     Returns:
         True if the status code is retryable
     """
-    if config is None:
-        config = RetryConfig()
-    return status_code in config.retryable_status_codes
+    codes = _DEFAULT_RETRYABLE_CODES if config is None else config._retryable_codes
+    return status_code in codes
@@ -1,8 +1,9 @@
 """File matching and movie ID extraction for JAV files"""
 
+import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 # Supported video extensions
@@ -38,6 +39,27 @@ JAV_ID_PATTERNS = [
     r"(\d{6})-(\d{3})",
 ]
 
+# Patterns used by extract_movie_id, tried in this order. A single combined
+# alternation would return the leftmost match instead, so e.g. a date-like
+# "123456-789" ahead of an FC2 ID would win; keep them separate.
+_SQUARE_BRACKETS_RE = re.compile(r"\[[^\]]*\]")
+_PARENTHESES_RE = re.compile(r"\([^)]*\)")
+_FC2_RE = re.compile(r"FC2[-_]?(?:PPV)?[-_]?(\d{5,7})", re.IGNORECASE)
+_HEYZO_RE = re.compile(r"HEYZO[-_]?(\d{4})", re.IGNORECASE)
+_CARIB_RE = re.compile(r"(\d{6})[-_](\d{3})")
+_SPECIAL_RE = re.compile(r"\b([a-zA-Z]\d+)[-_]?(\d{2,5})", re.IGNORECASE)
+_STANDARD_RE = re.compile(r"([a-zA-Z]{2,10})[-_]?(\d{2,5})", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+_ID_PARTS_RE = re.compile(r"([A-Z]+)(\d+)")
+
+
+def _clean_filename(filename: str) -> str:
+    """Strip the extension and bracketed tags like [SubGroup] or (Year)."""
+    name = Path(filename).stem
+    name = _SQUARE_BRACKETS_RE.sub("", name)
+    name = _PARENTHESES_RE.sub("", name)
+    return name.strip()
+
 
 def extract_movie_id(filename: str) -> Optional[str]:
     """
@@ -57,31 +79,30 @@ def extract_movie_id(filename: str) -> Optional[str]:
         >>> extract_movie_id("abc123.mp4")
         'ABC-123'
     """
-    # Remove file extension
-    name = Path(filename).stem
+    # Remove file extension and common prefixes like [SubGroup], (Year), etc.
+    name = _clean_filename(filename)
 
-    # Remove common prefixes like [SubGroup], (Year), etc.
-    name = re.sub(r"\[[^\]]*\]", "", name)
-    name = re.sub(r"\([^)]*\)", "", name)
-    name = name.strip()
+    # Every pattern needs digits; skip the scans for names like "vacation_video"
+    if not _DIGIT_RE.search(name):
+        return None
 
     # Try FC2 pattern FIRST (before standard pattern catches it)
-    fc2_match = re.search(r"FC2[-_]?(?:PPV)?[-_]?(\d{5,7})", name, re.IGNORECASE)
+    fc2_match = _FC2_RE.search(name)
     if fc2_match:
         return f"FC2-PPV-{fc2_match.group(1)}"
 
     # Try HEYZO pattern
-    heyzo_match = re.search(r"HEYZO[-_]?(\d{4})", name, re.IGNORECASE)
+    heyzo_match = _HEYZO_RE.search(name)
     if heyzo_match:
         return f"HEYZO-{heyzo_match.group(1)}"
 
     # Try Caribbeancom pattern (123456-789) before standard
-    carib_match = re.search(r"(\d{6})[-_](\d{3})", name)
+    carib_match = _CARIB_RE.search(name)
     if carib_match:
         return f"{carib_match.group(1)}-{carib_match.group(2)}"
 
     # Try special studios: T28-123, S1-123 (Letter + Digits)
-    special_match = re.search(r"\b([a-zA-Z]\d+)[-_]?(\d{2,5})", name, re.IGNORECASE)
+    special_match = _SPECIAL_RE.search(name)
     if special_match:
         prefix = special_match.group(1).upper()
         number = special_match.group(2)
@@ -89,7 +110,7 @@ def extract_movie_id(filename: str) -> Optional[str]:
 
     # Try standard JAV pattern (most common)
     # Match: ABC-123, ABC123, SSNI-486, etc.
-    standard_match = re.search(r"([a-zA-Z]{2,10})[-_]?(\d{2,5})", name, re.IGNORECASE)
+    standard_match = _STANDARD_RE.search(name)
     if standard_match:
         prefix = standard_match.group(1).upper()
         number = standard_match.group(2).lstrip("0") or "0"
@@ -98,6 +119,29 @@ def extract_movie_id(filename: str) -> Optional[str]:
     return None
 
 
+def extract_movie_ids(filenames: Iterable[str]) -> list[Optional[str]]:
+    """
+    Extract JAV movie IDs from many filenames at once.
+
+    Names are deduplicated first, so e.g. the same file seen in several
+    folders is only parsed once.
+
+    Args:
+        filenames: Video filenames (with or without extension)
+
+    Returns:
+        Extracted movie IDs, one per filename in input order (None where
+        no ID was found)
+
+    Examples:
+        >>> extract_movie_ids(["IPX-486.mp4", "vacation.mp4"])
+        ['IPX-486', None]
+    """
+    names = list(filenames)
+    found = {name: extract_movie_id(name) for name in dict.fromkeys(names)}
+    return [found[name] for name in names]
+
+
 def extract_movie_id_with_custom(
     filename: str,
     custom_patterns: Optional[list[str]] = None,
@@ -119,10 +163,7 @@ def extract_movie_id_with_custom(
         'CUSTOM-1234'
     """
     # Remove file extension and clean up
-    name = Path(filename).stem
-    name = re.sub(r"\[[^\]]*\]", "", name)
-    name = re.sub(r"\([^)]*\)", "", name)
-    name = name.strip()
+    name = _clean_filename(filename)
 
     # Try custom patterns first if priority is "before"
     if priority == "before" and custom_patterns:
@@ -182,7 +223,7 @@ def normalize_movie_id(movie_id: str) -> str:
         return movie_id
 
     # Split letters and numbers
-    match = re.match(r"([A-Z]+)(\d+)", movie_id)
+    match = _ID_PARTS_RE.match(movie_id)
     if match:
         prefix = match.group(1)
         number = match.group(2).lstrip("0") or "0"
@@ -211,12 +252,24 @@ def find_video_files(
     min_size_bytes = min_size_mb * 1024 * 1024
     videos = []
 
-    pattern = "**/*" if recursive else "*"
-
-    for path in directory.glob(pattern):
-        if path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS:
-            if min_size_bytes == 0 or path.stat().st_size >= min_size_bytes:
-                videos.append(path)
+    # os.scandir hands back cached file type info (and, on Windows, the
+    # stat result), so only size-filtered candidates cost an extra stat
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        pending.append(current / entry.name)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        if min_size_bytes == 0 or entry.stat().st_size >= min_size_bytes:
+                            videos.append(current / entry.name)
+        except PermissionError:
+            continue
 
     return sorted(videos)
 
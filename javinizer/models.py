@@ -1,9 +1,10 @@
 """Pydantic data models for JAV metadata"""
 
+import sys
 from datetime import date
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class Actress(BaseModel):
@@ -17,14 +18,18 @@ class Actress(BaseModel):
     @property
     def full_name(self) -> str:
         """Get full name in Western order (First Last)"""
-        parts = [self.first_name, self.last_name]
-        return " ".join(p for p in parts if p) or self.japanese_name or "Unknown"
+        first, last = self.first_name, self.last_name
+        if first and last:
+            return f"{first} {last}"
+        return first or last or self.japanese_name or "Unknown"
 
     @property
     def full_name_japanese_order(self) -> str:
         """Get full name in Japanese order (Last First)"""
-        parts = [self.last_name, self.first_name]
-        return " ".join(p for p in parts if p) or self.japanese_name or "Unknown"
+        first, last = self.first_name, self.last_name
+        if first and last:
+            return f"{last} {first}"
+        return last or first or self.japanese_name or "Unknown"
 
 
 class Rating(BaseModel):
@@ -72,6 +77,34 @@ class MovieMetadata(BaseModel):
     # Source tracking
     source: str = "unknown"
 
+    @field_validator("source")
+    @classmethod
+    def _intern_source(cls, value: str) -> str:
+        # A handful of scraper names repeat across every movie in a batch
+        return sys.intern(value)
+
+    @field_validator("genres")
+    @classmethod
+    def _intern_genres(cls, value: list[str]) -> list[str]:
+        # Genre names repeat heavily across a library; share one copy each
+        return [sys.intern(genre) for genre in value]
+
+    @classmethod
+    def from_validated(cls, **fields: Any) -> "MovieMetadata":
+        """Build metadata from values that are already validated.
+
+        Skips pydantic validation, so only use it when every value comes
+        from existing MovieMetadata instances (e.g. when merging scraper
+        results). Anything built from raw input must go through __init__.
+
+        Args:
+            **fields: Field values with their final types
+
+        Returns:
+            New MovieMetadata instance
+        """
+        return cls.model_construct(**fields)
+
     @property
     def year(self) -> Optional[int]:
         """Extract year from release date"""
@@ -1,19 +1,27 @@
 """NFO XML generator for Jellyfin/Kodi/Plex/Emby compatibility"""
 
+import re
 from xml.etree import ElementTree as ET
 from xml.dom import minidom
 from typing import Optional
 
 from javinizer.models import MovieMetadata
 
+# Only escape characters that are invalid in XML content
+# Note: / is valid in XML and should NOT be escaped
+_XML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_NEEDS_ESCAPE_RE = re.compile(r"[&<>]")
+
 
 def escape_xml_chars(text: str) -> str:
     """Escape special XML characters"""
     if not text:
         return ""
-    # Only escape characters that are invalid in XML content
-    # Note: / is valid in XML and should NOT be escaped
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    # Most text has nothing to escape, so skip building a copy of it
+    if _NEEDS_ESCAPE_RE.search(text) is None:
+        return text
+    # One pass over the text instead of one str.replace per character
+    return text.translate(_XML_ESCAPE_TABLE)
 
 
 def generate_nfo(
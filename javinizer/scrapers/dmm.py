@@ -6,6 +6,7 @@ from typing import Optional
 from urllib.parse import quote
 
 from bs4 import BeautifulSoup, Tag
+from bs4.filter import SoupStrainer
 
 from javinizer.models import Actress, MovieMetadata, ProxyConfig, Rating
 from javinizer.scrapers.base import BaseScraper
@@ -13,12 +14,16 @@ from javinizer.scrapers.utils import (
     normalize_id_variants,
     normalize_id,
     content_id_to_movie_id,
+    is_japanese,
     is_valid_actress_name,
 )
 from javinizer.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Search pages only need their detail links, so skip building the rest of the tree
+_DETAIL_LINKS = SoupStrainer("a", href=re.compile(r"/detail/"))
+
 
 class DMMScraper(BaseScraper):
     """Scraper for DMM.co.jp (Fanza)"""
@@ -58,7 +63,7 @@ class DMMScraper(BaseScraper):
         return client
 
     @staticmethod
-    def get_id_variants(movie_id: str) -> list[str]:
+    def get_id_variants(movie_id: str) -> tuple[str, ...]:
         """Generate possible content ID formats for a movie ID"""
         return normalize_id_variants(movie_id)
 
@@ -112,7 +117,7 @@ class DMMScraper(BaseScraper):
             if "video.dmm.co.jp" in str(response.url):
                 return None
 
-            soup = BeautifulSoup(response.content, "lxml")
+            soup = BeautifulSoup(response.text, "lxml", parse_only=_DETAIL_LINKS)
 
             # Find first result link
             result = soup.select_one('a[href*="/detail/"]')
@@ -143,8 +148,9 @@ class DMMScraper(BaseScraper):
             logger.error(f"Error fetching {url}: {e}", exc_info=True)
             return None
 
-        soup = BeautifulSoup(response.content, "lxml")
+        # Parse the decoded text so BeautifulSoup skips its own charset sniffing
         html = response.text
+        soup = BeautifulSoup(html, "lxml")
 
         # Extract content ID from URL
         content_id = self._extract_content_id(url)
@@ -286,13 +292,11 @@ class DMMScraper(BaseScraper):
                     seen_names.add(name)
 
                     # Check if name is Japanese
-                    is_japanese = bool(
-                        re.search(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]", name)
-                    )
+                    japanese = is_japanese(name)
 
                     actress = Actress(
-                        japanese_name=name if is_japanese else None,
-                        first_name=name if not is_japanese else None,
+                        japanese_name=name if japanese else None,
+                        first_name=name if not japanese else None,
                     )
                     actresses.append(actress)
                 break  # Use first pattern that matches
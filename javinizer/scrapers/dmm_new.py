@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Optional
 
 from javinizer.models import Actress, MovieMetadata, ProxyConfig
+from javinizer.scrapers.utils import is_japanese
 from javinizer.logger import get_logger
 
 logger = get_logger(__name__)
@@ -345,15 +346,11 @@ class DMMNewScraper:
                         if any(k in name for k in skip_keywords):
                             continue
 
-                        is_japanese = bool(
-                            re.search(
-                                r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]", name
-                            )
-                        )
+                        japanese = is_japanese(name)
                         actresses.append(
                             Actress(
-                                japanese_name=name if is_japanese else None,
-                                first_name=name if not is_japanese else None,
+                                japanese_name=name if japanese else None,
+                                first_name=name if not japanese else None,
                             )
                         )
                     except Exception:
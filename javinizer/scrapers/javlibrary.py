@@ -10,6 +10,7 @@ from bs4 import BeautifulSoup
 
 from javinizer.models import Actress, MovieMetadata, ProxyConfig, Rating
 from javinizer.scrapers.base import BaseScraper
+from javinizer.scrapers.utils import is_japanese
 from javinizer.logger import get_logger
 
 logger = get_logger(__name__)
@@ -63,7 +64,8 @@ class JavlibraryScraper(BaseScraper):
             if "cf-ray" in headers or "cf-cache-status" in headers:
                 return True
         if response.status_code == 503:
-            if "challenge" in response.text.lower() or "cf-" in response.text.lower():
+            body = response.text.lower()
+            if "challenge" in body or "cf-" in body:
                 return True
         return False
 
@@ -111,7 +113,7 @@ class JavlibraryScraper(BaseScraper):
             return str(response.url)
 
         # Parse search results
-        soup = BeautifulSoup(response.content, "lxml")
+        soup = BeautifulSoup(response.text, "lxml")
 
         # Look for exact match in results
         # movie_id_upper = movie_id.upper().replace("-", "")
@@ -145,8 +147,9 @@ class JavlibraryScraper(BaseScraper):
             logger.error(f"Error fetching Javlibrary page: {e}", exc_info=True)
             return None
 
-        soup = BeautifulSoup(response.content, "lxml")
+        # Parse the decoded text so BeautifulSoup skips its own charset sniffing
         html = response.text
+        soup = BeautifulSoup(html, "lxml")
 
         # Check for Cloudflare challenge - real challenge pages are short and have specific markers
         # Normal pages may have "challenge-platform" in Cloudflare scripts but are NOT challenge pages
@@ -251,12 +254,7 @@ class JavlibraryScraper(BaseScraper):
             if not name:
                 continue
 
-            # Check if name is Japanese
-            is_japanese = bool(
-                re.search(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]", name)
-            )
-
-            if is_japanese:
+            if is_japanese(name):
                 actress = Actress(japanese_name=name)
             else:
                 parts = name.split(" ")
@@ -9,7 +9,7 @@ NOTE: Requires Japan proxy to access. Configure proxy in settings.
 import re
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import quote, urljoin
 
 from javinizer.models import Actress, MovieMetadata, ProxyConfig
 from javinizer.scrapers.base import BaseScraper
@@ -17,6 +17,88 @@ from javinizer.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Extraction patterns, compiled once at import
+_SEARCH_ID_RE = re.compile(r'([A-Z]+)[-_]?(\d+)', re.IGNORECASE)
+_PRODUCT_LINK_RE = re.compile(r'/product/product_detail/([A-Z0-9-]+)/')
+_ID_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-"
+_URL_ID_RE = re.compile(r'/product_detail/([A-Z0-9-]+)/?', re.IGNORECASE)
+_HTML_ID_RE = re.compile(
+    r'>(?:品番|Product ID)[：:]?\s*</th>\s*<td[^>]*>([A-Z0-9-]+)</td>',
+    re.IGNORECASE,
+)
+_TITLE_RE = re.compile(r'<h1[^>]*class="tag"[^>]*>([^<]+)</h1>')
+_TITLE_TAG_RE = re.compile(r'<title>([^<]+)</title>')
+_SITE_NAME_JA_RE = re.compile(r'\s*[-|]\s*MGステージ.*$')
+_SITE_NAME_RE = re.compile(r'\s*[-|]\s*MGS.*$')
+_DESCRIPTION_RE = re.compile(
+    r'<p[^>]*class="[^"]*introduction[^"]*"[^>]*>(.*?)</p>',
+    re.DOTALL | re.IGNORECASE,
+)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_DATE_SLASH_RE = re.compile(
+    r'>(?:配信開始日|配信日|発売日|Release)[：:]?\s*</th>\s*<td[^>]*>(\d{4}/\d{2}/\d{2})</td>'
+)
+_DATE_DASH_RE = re.compile(
+    r'>(?:配信開始日|配信日|発売日)[：:]?\s*</th>\s*<td[^>]*>(\d{4}-\d{2}-\d{2})</td>'
+)
+_RUNTIME_RE = re.compile(
+    r'>(?:収録時間|再生時間|Duration)[：:]?\s*</th>\s*<td[^>]*>(\d+)\s*分</td>'
+)
+_MAKER_RE = re.compile(
+    r'<th>(?:メーカー|Maker|Studio)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
+    re.IGNORECASE | re.DOTALL,
+)
+_LABEL_RE = re.compile(
+    r'<th>(?:レーベル|Label)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
+    re.IGNORECASE | re.DOTALL,
+)
+_SERIES_RE = re.compile(
+    r'<th>(?:シリーズ|Series)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
+    re.IGNORECASE | re.DOTALL,
+)
+_ACTRESS_ROW_RE = re.compile(
+    r'<th>(?:出演|Actresses|Cast)[：:]?</th>\s*<td>(.*?)</td>',
+    re.IGNORECASE | re.DOTALL,
+)
+# Pattern: <a href="/actress/...">Name</a> or /search/cSearch.php?actor[]=...
+_ACTRESS_LINK_RE = re.compile(
+    r'<a[^>]*href="[^"]*(?:/actress/|/talent/|actor\[\])[^"]*"[^>]*>([^<]+)</a>',
+    re.IGNORECASE,
+)
+_GENRE_ROW_RE = re.compile(
+    r'<th>(?:ジャンル|Genre)[：:]?</th>\s*<td>(.*?)</td>',
+    re.IGNORECASE | re.DOTALL,
+)
+_GENRE_LINK_RE = re.compile(
+    r'<a[^>]*href="[^"]*(?:/genre/|genre\[\])[^"]*"[^>]*>([^<]+)</a>',
+    re.IGNORECASE,
+)
+_COVER_MAGNIFY_RE = re.compile(
+    r'<a[^>]+(?:class="[^"]*link_magnify[^"]*"[^>]+href="([^"]+)"|href="([^"]+)"[^>]+class="[^"]*link_magnify[^"]*")',
+    re.IGNORECASE,
+)
+_COVER_SAMPLE_RE = re.compile(
+    r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*sample_image[^"]*"',
+    re.IGNORECASE,
+)
+_COVER_IMG_RE = re.compile(
+    r'<img[^>]*class="[^"]*(?:detail_img|enlarge_image)[^"]*"[^>]*src="([^"]+)"',
+    re.IGNORECASE,
+)
+_SCREENSHOT_RE = re.compile(
+    r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*sample[^"]*"[^>]*>',
+    re.IGNORECASE,
+)
+_TRAILER_RE = re.compile(r'sampleMovie["\']?\s*[:=]\s*["\']([^"\']+)["\']')
+_TRAILER_DATA_RE = re.compile(r'data-video\s*=\s*["\']([^"\']+)["\']')
+
+# Literal markers found only on product detail pages
+_VALID_PAGE_MARKERS = (
+    '<div class="common_detail_cover"',
+    'class="detail_data"',
+    '<h1 class="tag">',
+)
+
 
 class MGStageScraper(BaseScraper):
     """
@@ -33,6 +115,7 @@ class MGStageScraper(BaseScraper):
 
     name = "mgstage"
     base_url = "https://www.mgstage.com"
+    search_url_template = f"{base_url}/search/cSearch.php?search_word={{}}&sort=new"
 
     # Age verification cookie required
     AGE_CHECK_COOKIE = {"adc": "1"}
@@ -58,7 +141,7 @@ class MGStageScraper(BaseScraper):
 
     def get_search_url(self, movie_id: str) -> str:
         """Build search URL for movie ID"""
-        return f"{self.base_url}/search/cSearch.php?search_word={movie_id.strip()}&sort=new"
+        return self.search_url_template.format(quote(movie_id.strip()))
 
     def get_movie_url(self, movie_id: str) -> Optional[str]:
         """Get movie URL from movie ID"""
@@ -85,7 +168,7 @@ class MGStageScraper(BaseScraper):
             
         # Search strategy 2: Numeric part search (robust for prefixed/suffixed IDs)
         # e.g. START-469 -> search 469, match START
-        match = re.search(r'([A-Z]+)[-_]?(\d+)', movie_id, re.IGNORECASE)
+        match = _SEARCH_ID_RE.search(movie_id)
         if match:
             alpha = match.group(1)
             num = match.group(2)
@@ -97,14 +180,13 @@ class MGStageScraper(BaseScraper):
 
     def _search_and_find(self, query: str, filter_text: str) -> Optional[str]:
         """Search not finding the query, but filtering results"""
-        search_url = f"{self.base_url}/search/cSearch.php?search_word={query}&sort=new"
         try:
-            response = self.client.get(search_url)
+            response = self.client.get(self.get_search_url(query))
             if response.status_code != 200:
                 return None
                 
             # Parse results
-            found_ids = list(set(re.findall(r'/product/product_detail/([A-Z0-9-]+)/', response.text)))
+            found_ids = list(set(_PRODUCT_LINK_RE.findall(response.text)))
             
             clean_filter = filter_text.replace("-", "").upper()
             
@@ -120,11 +202,7 @@ class MGStageScraper(BaseScraper):
         
     def _is_valid_movie_page(self, html: str) -> bool:
         """Check if HTML contains valid movie content"""
-        return (
-            '<div class="common_detail_cover"' in html or
-            'class="detail_data"' in html or
-            '<h1 class="tag">' in html
-        )
+        return any(marker in html for marker in _VALID_PAGE_MARKERS)
 
     def scrape(self, url: str) -> Optional[MovieMetadata]:
         """Scrape metadata from MGStage movie page"""
@@ -147,10 +225,11 @@ class MGStageScraper(BaseScraper):
                 logger.debug(f"[{self.name}] Could not extract movie ID from {url}")
                 return None
 
+            title = self._extract_title(html)
             metadata = MovieMetadata(
                 id=movie_id,
-                title=self._extract_title(html),
-                original_title=self._extract_title(html),  # MGStage is Japanese only
+                title=title,
+                original_title=title,  # MGStage is Japanese only
                 description=self._extract_description(html),
                 release_date=self._extract_date(html),
                 runtime=self._extract_runtime(html),
@@ -175,18 +254,21 @@ class MGStageScraper(BaseScraper):
 
     def _extract_id(self, html: str, url: str) -> Optional[str]:
         """Extract movie ID from HTML or URL"""
-        # Try to get from URL first
-        match = re.search(r'/product_detail/([A-Z0-9-]+)/?', url, re.IGNORECASE)
+        # Try to get from URL first; plain /product_detail/ID/ URLs are sliced
+        # out directly, anything unusual goes through the regex
+        _, sep, rest = url.partition("/product_detail/")
+        if sep:
+            candidate = rest.partition("/")[0]
+            if candidate and not candidate.strip(_ID_CHARS):
+                return candidate.upper()
+
+        match = _URL_ID_RE.search(url)
         if match:
             return match.group(1).upper()
 
         # Try from page content
         # Pattern: 品番: ABC-123
-        match = re.search(
-            r'>(?:品番|Product ID)[：:]?\s*</th>\s*<td[^>]*>([A-Z0-9-]+)</td>',
-            html,
-            re.IGNORECASE,
-        )
+        match = _HTML_ID_RE.search(html)
         if match:
             return match.group(1).upper()
 
@@ -195,17 +277,17 @@ class MGStageScraper(BaseScraper):
     def _extract_title(self, html: str) -> str:
         """Extract movie title"""
         # Pattern: <h1 class="tag">Title</h1>
-        match = re.search(r'<h1[^>]*class="tag"[^>]*>([^<]+)</h1>', html)
+        match = _TITLE_RE.search(html)
         if match:
             return match.group(1).strip()
 
         # Alternative: <title> tag
-        match = re.search(r'<title>([^<]+)</title>', html)
+        match = _TITLE_TAG_RE.search(html)
         if match:
             title = match.group(1).strip()
             # Remove site name suffix
-            title = re.sub(r'\s*[-|]\s*MGステージ.*$', '', title)
-            title = re.sub(r'\s*[-|]\s*MGS.*$', '', title)
+            title = _SITE_NAME_JA_RE.sub('', title)
+            title = _SITE_NAME_RE.sub('', title)
             return title
 
         return "Unknown"
@@ -213,15 +295,11 @@ class MGStageScraper(BaseScraper):
     def _extract_description(self, html: str) -> Optional[str]:
         """Extract movie description"""
         # Pattern: <p class="introduction">Description</p>
-        match = re.search(
-            r'<p[^>]*class="[^"]*introduction[^"]*"[^>]*>(.*?)</p>',
-            html,
-            re.DOTALL | re.IGNORECASE,
-        )
+        match = _DESCRIPTION_RE.search(html)
         if match:
             desc = match.group(1)
             # Clean HTML tags
-            desc = re.sub(r'<[^>]+>', '', desc)
+            desc = _HTML_TAG_RE.sub('', desc)
             desc = desc.strip()
             return desc if desc else None
         return None
@@ -229,10 +307,7 @@ class MGStageScraper(BaseScraper):
     def _extract_date(self, html: str) -> Optional[datetime]:
         """Extract release date"""
         # Pattern: 配信開始日: 2024/01/15
-        match = re.search(
-            r'>(?:配信開始日|配信日|発売日|Release)[：:]?\s*</th>\s*<td[^>]*>(\d{4}/\d{2}/\d{2})</td>',
-            html,
-        )
+        match = _DATE_SLASH_RE.search(html)
         if match:
             try:
                 return datetime.strptime(match.group(1), "%Y/%m/%d").date()
@@ -240,10 +315,7 @@ class MGStageScraper(BaseScraper):
                 pass
 
         # Alternative format: 2024-01-15
-        match = re.search(
-            r'>(?:配信開始日|配信日|発売日)[：:]?\s*</th>\s*<td[^>]*>(\d{4}-\d{2}-\d{2})</td>',
-            html,
-        )
+        match = _DATE_DASH_RE.search(html)
         if match:
             try:
                 return datetime.strptime(match.group(1), "%Y-%m-%d").date()
@@ -255,10 +327,7 @@ class MGStageScraper(BaseScraper):
     def _extract_runtime(self, html: str) -> Optional[int]:
         """Extract runtime in minutes"""
         # Pattern: 収録時間: 120分
-        match = re.search(
-            r'>(?:収録時間|再生時間|Duration)[：:]?\s*</th>\s*<td[^>]*>(\d+)\s*分</td>',
-            html,
-        )
+        match = _RUNTIME_RE.search(html)
         if match:
             return int(match.group(1))
         return None
@@ -266,33 +335,21 @@ class MGStageScraper(BaseScraper):
     def _extract_maker(self, html: str) -> Optional[str]:
         """Extract studio/maker name"""
         # Search within the table row for Maker
-        match = re.search(
-            r'<th>(?:メーカー|Maker|Studio)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
-            html,
-            re.IGNORECASE | re.DOTALL,
-        )
+        match = _MAKER_RE.search(html)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_label(self, html: str) -> Optional[str]:
         """Extract label name"""
-        match = re.search(
-            r'<th>(?:レーベル|Label)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
-            html,
-            re.IGNORECASE | re.DOTALL,
-        )
+        match = _LABEL_RE.search(html)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_series(self, html: str) -> Optional[str]:
         """Extract series name"""
-        match = re.search(
-            r'<th>(?:シリーズ|Series)[：:]?</th>\s*<td>\s*<a[^>]*>([^<]+)</a>',
-            html,
-            re.IGNORECASE | re.DOTALL,
-        )
+        match = _SERIES_RE.search(html)
         if match:
             return match.group(1).strip()
         return None
@@ -303,11 +360,7 @@ class MGStageScraper(BaseScraper):
         
         # Find the row containing actresses
         # <tr><th>出演：</th><td>...</td></tr>
-        row_match = re.search(
-            r'<th>(?:出演|Actresses|Cast)[：:]?</th>\s*<td>(.*?)</td>',
-            html,
-            re.IGNORECASE | re.DOTALL
-        )
+        row_match = _ACTRESS_ROW_RE.search(html)
         
         if not row_match:
             return []
@@ -315,14 +368,8 @@ class MGStageScraper(BaseScraper):
         content = row_match.group(1)
         
         # Extract links from the cell content
-        # Pattern: <a href="/actress/...">Name</a> or /search/cSearch.php?actor[]=...
-        pattern = re.compile(
-            r'<a[^>]*href="[^"]*(?:/actress/|/talent/|actor\[\])[^"]*"[^>]*>([^<]+)</a>',
-            re.IGNORECASE,
-        )
-
         found_names = set()
-        for match in pattern.finditer(content):
+        for match in _ACTRESS_LINK_RE.finditer(content):
             name = match.group(1).strip()
             if not name or name in ("---", "----") or name in found_names:
                 continue
@@ -343,11 +390,7 @@ class MGStageScraper(BaseScraper):
         genres = []
 
         # Find the row containing genres
-        row_match = re.search(
-            r'<th>(?:ジャンル|Genre)[：:]?</th>\s*<td>(.*?)</td>',
-            html,
-            re.IGNORECASE | re.DOTALL
-        )
+        row_match = _GENRE_ROW_RE.search(html)
         
         if not row_match:
             return []
@@ -355,12 +398,7 @@ class MGStageScraper(BaseScraper):
         content = row_match.group(1)
         
         # Extract links from the cell content
-        pattern = re.compile(
-            r'<a[^>]*href="[^"]*(?:/genre/|genre\[\])[^"]*"[^>]*>([^<]+)</a>',
-            re.IGNORECASE,
-        )
-
-        for match in pattern.finditer(content):
+        for match in _GENRE_LINK_RE.finditer(content):
             genre = match.group(1).strip()
             if genre and genre not in genres:
                 genres.append(genre)
@@ -374,31 +412,19 @@ class MGStageScraper(BaseScraper):
         
         # Unified regex for link_magnify (common case)
         # Matches <a ... href="..." ... class="link_magnify" ...> or <a ... class="link_magnify" ... href="..." ...>
-        match = re.search(
-            r'<a[^>]+(?:class="[^"]*link_magnify[^"]*"[^>]+href="([^"]+)"|href="([^"]+)"[^>]+class="[^"]*link_magnify[^"]*")',
-            html,
-            re.IGNORECASE
-        )
+        match = _COVER_MAGNIFY_RE.search(html)
         if match:
             # Group 1 is from class...href, Group 2 is from href...class
             url = match.group(1) or match.group(2)
             return self._normalize_url(url)
 
         # Pattern: <a href="large_cover.jpg" class="sample_image"> (Old)
-        match = re.search(
-            r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*sample_image[^"]*"',
-            html,
-            re.IGNORECASE
-        )
+        match = _COVER_SAMPLE_RE.search(html)
         if match:
             return self._normalize_url(match.group(1))
 
         # Alternative: main image (enlarge_image or detail_img)
-        match = re.search(
-            r'<img[^>]*class="[^"]*(?:detail_img|enlarge_image)[^"]*"[^>]*src="([^"]+)"',
-            html,
-            re.IGNORECASE
-        )
+        match = _COVER_IMG_RE.search(html)
         if match:
              # This is usually a smaller image or package shot, but better than nothing
             return self._normalize_url(match.group(1))
@@ -416,12 +442,7 @@ class MGStageScraper(BaseScraper):
         screenshots = []
 
         # Pattern: sample images in gallery
-        pattern = re.compile(
-            r'<a[^>]*href="([^"]+)"[^>]*class="[^"]*sample[^"]*"[^>]*>',
-            re.IGNORECASE,
-        )
-
-        for match in pattern.finditer(html):
+        for match in _SCREENSHOT_RE.finditer(html):
             url = match.group(1)
             if not url.startswith("http"):
                 url = urljoin(self.base_url, url)
@@ -433,18 +454,12 @@ class MGStageScraper(BaseScraper):
     def _extract_trailer(self, html: str) -> Optional[str]:
         """Extract trailer/sample video URL"""
         # Pattern: sample movie URL
-        match = re.search(
-            r'sampleMovie["\']?\s*[:=]\s*["\']([^"\']+)["\']',
-            html,
-        )
+        match = _TRAILER_RE.search(html)
         if match:
             return match.group(1)
 
         # Alternative: data-video attribute
-        match = re.search(
-            r'data-video\s*=\s*["\']([^"\']+)["\']',
-            html,
-        )
+        match = _TRAILER_DATA_RE.search(html)
         if match:
             return match.group(1)
 
@@ -1,6 +1,6 @@
 """R18Dev JSON API scraper for metadata"""
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 import httpx
@@ -59,7 +59,7 @@ class R18DevScraper(BaseScraper):
         return self._client
 
     @staticmethod
-    def get_id_variants(movie_id: str) -> list[str]:
+    def get_id_variants(movie_id: str) -> tuple[str, ...]:
         """Generate possible content ID formats for a movie ID"""
         return normalize_id_variants(movie_id)
 
@@ -155,14 +155,18 @@ class R18DevScraper(BaseScraper):
             or "Unknown"
         )
 
-    def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
+    def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
         """Parse release date string"""
         if not date_str:
             return None
         try:
-            # Format: "2020-09-12 00:00:00" or "2020-09-12"
-            date_part = date_str.split(" ")[0]
-            return datetime.strptime(date_part, "%Y-%m-%d").date()
+            # Format: "2020-09-12 00:00:00", "2020-09-12T00:00:00Z" or "2020-09-12"
+            return date.fromisoformat(date_str[:10])
+        except (ValueError, TypeError):
+            pass
+        try:
+            # Rare unpadded dates ("2020-9-12") that fromisoformat rejects
+            return datetime.strptime(date_str.split(" ")[0], "%Y-%m-%d").date()
         except (ValueError, AttributeError):
             return None
 
@@ -175,28 +179,27 @@ class R18DevScraper(BaseScraper):
 
     def _parse_actresses(self, data: dict) -> list[Actress]:
         """Parse actress information from JSON"""
-        actresses = []
-
-        for actress_data in data.get("actresses", []):
-            name_romaji = actress_data.get("name_romaji", "")
-            name_parts = name_romaji.split(" ") if name_romaji else []
-
-            # Get thumb URL
-            thumb_url = actress_data.get("image_url")
-            if thumb_url and not thumb_url.startswith("http"):
-                thumb_url = f"https://pics.dmm.co.jp/mono/actjpgs/{thumb_url}"
-
-            actress = Actress(
+        # Bound locally so the comprehension does plain local lookups per entry
+        make_actress = Actress
+        thumb_prefix = "https://pics.dmm.co.jp/mono/actjpgs/"
+        return [
+            make_actress(
                 first_name=name_parts[0] if name_parts else None,
                 last_name=name_parts[1] if len(name_parts) > 1 else None,
                 japanese_name=actress_data.get("name_kanji", "")
                 .replace("（.*）", "")
                 .replace("&amp;", "&"),
-                thumb_url=thumb_url,
+                # Relative thumb names live under the DMM actress image path
+                thumb_url=thumb_prefix + thumb_url
+                if thumb_url and not thumb_url.startswith("http")
+                else thumb_url,
             )
-            actresses.append(actress)
-
-        return actresses
+            for actress_data in data.get("actresses", [])
+            # Single-item loops bind per-entry values without a call frame
+            for name_romaji in [actress_data.get("name_romaji", "")]
+            for name_parts in [name_romaji.split(" ") if name_romaji else []]
+            for thumb_url in [actress_data.get("image_url")]
+        ]
 
     def _parse_genres(self, data: dict) -> list[str]:
         """Parse genre list from categories"""
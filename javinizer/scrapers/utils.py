@@ -2,11 +2,46 @@
 """Shared utility functions for scrapers"""
 
 import re
+import unicodedata
 from functools import lru_cache
 
-
-@lru_cache(maxsize=256)
-def normalize_id_variants(movie_id: str) -> list[str]:
+# Hiragana, katakana and common CJK ideographs
+_JAPANESE_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]")
+# Letters and digits of an uppercased movie ID (IPX-486, SSNI123)
+_ID_PARTS_RE = re.compile(r"([A-Z]+)-?([0-9]+)")
+# Optional digit prefix + letters + digits + optional suffix (1start422, ipx00486z)
+_CONTENT_ID_RE = re.compile(r"([0-9]*)([A-Za-z]+)([0-9]+)(.*)$")
+# Promotional text that shows up in DMM actress link text
+_INVALID_NAME_MARKERS = (
+    "★",
+    "☆",
+    "●",
+    "◆",
+    "■",  # Special markers
+    "ご購入",
+    "商品",
+    "こちら",  # Purchase/product text
+    "アダルトブック",
+    "写真集",  # Book/photobook promo
+    "http",
+    "www",
+    ".com",
+    ".jp",  # URLs
+    "限定",
+    "特典",
+    "キャンペーン",  # Limited/bonus/campaign
+    "配信",
+    "ダウンロード",  # Distribution/download
+)
+# All markers as one alternation, so a name is scanned once instead of once
+# per marker
+_INVALID_NAME_MARKERS_RE = re.compile("|".join(map(re.escape, _INVALID_NAME_MARKERS)))
+# Kana, kanji, Latin letters or space
+_NAME_CHARS_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf a-zA-Z]")
+
+
+@lru_cache(maxsize=4096)
+def normalize_id_variants(movie_id: str) -> tuple[str, ...]:
     """
     Generate possible content ID formats for a movie ID.
 
@@ -19,40 +54,36 @@ def normalize_id_variants(movie_id: str) -> list[str]:
         movie_id: Original movie ID (e.g., "IPX-486", "SSNI-123")
 
     Returns:
-        List of possible content IDs to try, with most common formats first
+        Tuple of possible content IDs to try, with most common formats first
+        (immutable, since results are cached and shared between callers)
     """
     movie_id = movie_id.upper().strip()
 
-    match = re.match(r"([A-Z]+)-?(\d+)", movie_id)
+    match = _ID_PARTS_RE.match(movie_id)
     if not match:
-        return [movie_id.lower()]
+        return (movie_id.lower(),)
 
     prefix, number = match.groups()
     prefix_lower = prefix.lower()
+    padded = number.zfill(5)
 
     # Generate multiple possible formats
-    variants = []
-
-    # Format 1: prefix + padded number (ipx00486) - most common
-    variants.append(f"{prefix_lower}{number.zfill(5)}")
-
-    # Format 2: digit prefix + prefix + number (1start422)
-    # Some content IDs have a leading digit (usually 1)
-    variants.append(f"1{prefix_lower}{number}")
-
-    # Format 3: prefix + number without padding
-    variants.append(f"{prefix_lower}{number}")
-
-    # Format 4: digit prefix + prefix + padded number
-    variants.append(f"1{prefix_lower}{number.zfill(5)}")
-
-    # Format 5: h_ prefix for amateur content
-    variants.append(f"h_{prefix_lower}{number.zfill(5)}")
-
-    return variants
+    return (
+        # Format 1: prefix + padded number (ipx00486) - most common
+        f"{prefix_lower}{padded}",
+        # Format 2: digit prefix + prefix + number (1start422)
+        # Some content IDs have a leading digit (usually 1)
+        f"1{prefix_lower}{number}",
+        # Format 3: prefix + number without padding
+        f"{prefix_lower}{number}",
+        # Format 4: digit prefix + prefix + padded number
+        f"1{prefix_lower}{padded}",
+        # Format 5: h_ prefix for amateur content
+        f"h_{prefix_lower}{padded}",
+    )
 
 
-@lru_cache(maxsize=256)
+@lru_cache(maxsize=4096)
 def normalize_id(movie_id: str) -> tuple[str, str]:
     """
     Convert movie ID to primary content ID format.
@@ -67,7 +98,7 @@ def normalize_id(movie_id: str) -> tuple[str, str]:
     """
     movie_id = movie_id.upper().strip()
 
-    match = re.match(r"([A-Z]+)-?(\d+)", movie_id)
+    match = _ID_PARTS_RE.match(movie_id)
     if not match:
         return movie_id.lower(), movie_id
 
@@ -88,8 +119,7 @@ def content_id_to_movie_id(content_id: str) -> str:
     Returns:
         Standard movie ID format (e.g., "IPX-486", "START-422")
     """
-    # Pattern: optional digit prefix + letters + digits + optional suffix
-    match = re.match(r"(\d*)([a-z]+)(\d+)(.*)$", content_id, re.IGNORECASE)
+    match = _CONTENT_ID_RE.match(content_id)
     if not match:
         return content_id.upper()
 
@@ -99,6 +129,19 @@ def content_id_to_movie_id(content_id: str) -> str:
     return f"{prefix.upper()}-{number}{suffix.upper()}"
 
 
+def is_japanese(text: str) -> bool:
+    """
+    Check if a string contains Japanese (kana or kanji) characters.
+
+    Args:
+        text: String to check
+
+    Returns:
+        True if any character is hiragana, katakana or a CJK ideograph
+    """
+    return _JAPANESE_RE.search(text) is not None
+
+
 def is_valid_actress_name(name: str) -> bool:
     """
     Check if a string is a valid actress name.
@@ -112,40 +155,17 @@ def is_valid_actress_name(name: str) -> bool:
     Returns:
         True if name appears to be a valid actress name
     """
+    # Fold fullwidth Latin/digits and halfwidth katakana once, so the checks
+    # below only need to know the canonical spelling of each marker
+    name = unicodedata.normalize("NFKC", name)
+
     # Names should be reasonable length (most Japanese names < 20 chars)
     if len(name) > 30:
         return False
 
     # Skip if contains promotional markers
-    invalid_markers = [
-        "★",
-        "☆",
-        "●",
-        "◆",
-        "■",  # Special markers
-        "ご購入",
-        "商品",
-        "こちら",  # Purchase/product text
-        "アダルトブック",
-        "写真集",  # Book/photobook promo
-        "http",
-        "www",
-        ".com",
-        ".jp",  # URLs
-        "限定",
-        "特典",
-        "キャンペーン",  # Limited/bonus/campaign
-        "配信",
-        "ダウンロード",  # Distribution/download
-    ]
-
-    for marker in invalid_markers:
-        if marker in name:
-            return False
+    if _INVALID_NAME_MARKERS_RE.search(name):
+        return False
 
     # Name should contain at least some Japanese or Latin characters
-    has_valid_chars = bool(
-        re.search(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf a-zA-Z]", name)
-    )
-
-    return has_valid_chars
+    return _NAME_CHARS_RE.search(name) is not None
@@ -3,6 +3,7 @@
 import re
 import shutil
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
 
@@ -13,6 +14,16 @@ from .models import MovieMetadata
 
 # Invalid characters for Windows filenames
 INVALID_FILENAME_CHARS = r'\/:*?"<>|'
+# Path separators become "-", everything else invalid is dropped
+_SANITIZE_TABLE = str.maketrans(
+    {char: "-" if char in "/:" else None for char in INVALID_FILENAME_CHARS}
+)
+
+# Template placeholders like <ID> or <TITLE>, captured so split() keeps them
+_PLACEHOLDER_RE = re.compile(r"(<[A-Z]+>)")
+_EMPTY_BRACKETS_RE = re.compile(r"\[\s*\]")
+_EMPTY_PARENS_RE = re.compile(r"\(\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 @dataclass
@@ -47,7 +58,7 @@ class SortConfig:
     group_actress: bool = True  # Use @Group for multiple actresses
 
 
-@dataclass
+@dataclass(slots=True)
 class SortPaths:
     """Generated paths for sorted movie files"""
 
@@ -74,17 +85,13 @@ def sanitize_filename(name: str) -> str:
         Sanitized filename safe for Windows
     """
     # Replace invalid characters
-    for char in INVALID_FILENAME_CHARS:
-        if char == "/" or char == ":":
-            name = name.replace(char, "-")
-        else:
-            name = name.replace(char, "")
+    name = name.translate(_SANITIZE_TABLE)
 
     # Remove leading/trailing dots and spaces
     name = name.strip(". ")
 
     # Collapse multiple spaces
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE_RE.sub(" ", name)
 
     return name
 
@@ -156,18 +163,8 @@ def format_actresses(
     return delimiter.join(sorted(names))
 
 
-def format_template(template: str, metadata: MovieMetadata, config: SortConfig) -> str:
-    """
-    Replace placeholders in template string with metadata values.
-
-    Args:
-        template: Template with placeholders like <ID>, <TITLE>
-        metadata: Movie metadata
-        config: Sort configuration
-
-    Returns:
-        Formatted string with placeholders replaced
-    """
+def _build_replacements(metadata: MovieMetadata, config: SortConfig) -> dict[str, str]:
+    """Map every template placeholder to its value for one movie."""
     # Prepare values
     title = metadata.title or "Unknown"
     if config.max_title_length > 0:
@@ -183,9 +180,7 @@ def format_template(template: str, metadata: MovieMetadata, config: SortConfig)
         group_if_multiple=config.group_actress,
     )
 
-    # Replace placeholders
-    result = template
-    replacements = {
+    return {
         "<ID>": metadata.id,
         "<TITLE>": title,
         "<ORIGINALTITLE>": metadata.original_title or title,
@@ -202,13 +197,26 @@ def format_template(template: str, metadata: MovieMetadata, config: SortConfig)
         "<CONTENTID>": metadata.content_id or metadata.id,
     }
 
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, value)
+
+@lru_cache(maxsize=64)
+def _split_template(template: str) -> tuple[str, ...]:
+    """Split a template into literal text (even indexes) and placeholders (odd)."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _render_template(template: str, replacements: dict[str, str]) -> str:
+    """Fill a template from prepared replacements and make it filesystem safe."""
+    # Templates are parsed once and reused for every movie; unknown
+    # placeholders are left as-is
+    parts = list(_split_template(template))
+    for i in range(1, len(parts), 2):
+        parts[i] = replacements.get(parts[i], parts[i])
+    result = "".join(parts)
 
     # Remove empty brackets and clean up
-    result = re.sub(r"\[\s*\]", "", result)
-    result = re.sub(r"\(\s*\)", "", result)
-    result = re.sub(r"\s+", " ", result)
+    result = _EMPTY_BRACKETS_RE.sub("", result)
+    result = _EMPTY_PARENS_RE.sub("", result)
+    result = _WHITESPACE_RE.sub(" ", result)
     result = result.strip()
 
     # Sanitize for filesystem
@@ -217,6 +225,21 @@ def format_template(template: str, metadata: MovieMetadata, config: SortConfig)
     return result
 
 
+def format_template(template: str, metadata: MovieMetadata, config: SortConfig) -> str:
+    """
+    Replace placeholders in template string with metadata values.
+
+    Args:
+        template: Template with placeholders like <ID>, <TITLE>
+        metadata: Movie metadata
+        config: Sort configuration
+
+    Returns:
+        Formatted string with placeholders replaced
+    """
+    return _render_template(template, _build_replacements(metadata, config))
+
+
 def generate_sort_paths(
     source_video: Path, dest_folder: Path, metadata: MovieMetadata, config: SortConfig
 ) -> SortPaths:
@@ -232,22 +255,23 @@ def generate_sort_paths(
     Returns:
         SortPaths with all generated paths
     """
-    # Format names
-    folder_name = format_template(config.folder_format, metadata, config)
-    file_name = format_template(config.file_format, metadata, config)
-    nfo_name = format_template(config.nfo_format, metadata, config)
+    # Format names; placeholder values are the same for every template
+    replacements = _build_replacements(metadata, config)
+    folder_name = _render_template(config.folder_format, replacements)
+    file_name = _render_template(config.file_format, replacements)
+    nfo_name = _render_template(config.nfo_format, replacements)
 
     # Build path with optional nested output_folder structure
     # e.g., ["<ACTORS>", "<YEAR>"] -> dest/<ACTORS>/<YEAR>/<folder_format>/
-    base_folder = dest_folder
-    if config.output_folder:
-        for level_template in config.output_folder:
-            level_name = format_template(level_template, metadata, config)
-            # Skip empty levels
-            if level_name and level_name.strip():
-                base_folder = base_folder / level_name
-
-    movie_folder = base_folder / folder_name
+    # Levels are joined in one step rather than building a Path per level
+    levels = []
+    for level_template in config.output_folder:
+        level_name = _render_template(level_template, replacements)
+        # Skip empty levels
+        if level_name and level_name.strip():
+            levels.append(level_name)
+
+    movie_folder = dest_folder.joinpath(*levels, folder_name)
     video_path = movie_folder / f"{file_name}{source_video.suffix}"
 
     paths = SortPaths(
@@ -14,7 +14,7 @@ from javinizer.models import MovieMetadata
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class ActressProfile:
     name: str
     aliases: List[str]
@@ -102,6 +102,9 @@ class ActressDB:
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
+            # Resolve the storage root once rather than once per profile
+            storage_abs = self.storage_path.resolve()
+
             with open(self.csv_path, "w", encoding="utf-8", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
@@ -111,7 +114,6 @@ class ActressDB:
                     if profile.local_path:
                         try:
                             abs_path = Path(profile.local_path).resolve()
-                            storage_abs = self.storage_path.resolve()
                             if abs_path.is_relative_to(storage_abs):
                                 local_path_str = str(
                                     abs_path.relative_to(storage_abs)
@@ -212,16 +214,19 @@ class ActressDB:
 
     def _map_path(self, path: Path) -> str:
         """Apply path mapping for cross-OS support"""
-        abs_path_str = str(path.resolve()).replace("\\", "/")
+        resolved = str(path.resolve())
+        abs_path_str = resolved.replace("\\", "/")
+        # Lowercase once; the path does not change between mappings
+        abs_path_lower = abs_path_str.lower()
 
         for local_prefix, remote_prefix in self.thumbs_config.path_mapping.items():
             # Normalize prefix
             local_prefix = local_prefix.replace("\\", "/")
-            if abs_path_str.lower().startswith(local_prefix.lower()):
+            if abs_path_lower.startswith(local_prefix.lower()):
                 # Case-insensitive replacement of prefix
                 return remote_prefix + abs_path_str[len(local_prefix) :]
 
-        return str(path.resolve())
+        return resolved
 
     async def _download_image(self, url: str, dest: Path) -> bool:
         """Download image to destination"""
@@ -280,3 +285,15 @@ class ActressDB:
             await self.get_local_path(profile)
             # NOTE: We do NOT replace actress.thumb_url with local path
             # Jellyfin will download from the online URL and cache internally
+
+
+# Global actress DB instance
+_global_actress_db: Optional[ActressDB] = None
+
+
+def get_actress_db() -> ActressDB:
+    """Get or create the global actress DB, loading settings and CSV once."""
+    global _global_actress_db
+    if _global_actress_db is None:
+        _global_actress_db = ActressDB()
+    return _global_actress_db
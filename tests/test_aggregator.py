@@ -211,6 +211,13 @@ class TestAggregateMetadata:
         # Rating should come from javlibrary (higher votes)
         # Genres should be union of all
 
+    def test_result_matches_validated_model(self, dmm_metadata, r18dev_metadata):
+        """Test the unvalidated construction yields a valid, independent model"""
+        result = aggregate_metadata({"dmm": dmm_metadata, "r18dev": r18dev_metadata})
+        assert MovieMetadata.model_validate(result.model_dump()) == result
+        assert result.screenshot_urls is not r18dev_metadata.screenshot_urls
+        assert result.actresses is not r18dev_metadata.actresses
+
 
 class TestMergeTwo:
     """Test merge_two function"""
@@ -239,3 +246,9 @@ class TestMergeTwo:
         result = merge_two(dmm_metadata, r18dev_metadata)
         assert "dmm" in result.source
         assert "r18dev" in result.source
+
+    def test_merge_result_matches_validated_model(self, dmm_metadata, r18dev_metadata):
+        """Test the unvalidated construction yields a valid, independent model"""
+        result = merge_two(dmm_metadata, r18dev_metadata)
+        assert MovieMetadata.model_validate(result.model_dump()) == result
+        assert result.actresses is not dmm_metadata.actresses
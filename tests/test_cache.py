@@ -6,48 +6,64 @@ from pathlib import Path
 from datetime import date
 import tempfile
 
-from javinizer.cache.manager import CacheManager, CacheConfig
+from javinizer.cache.manager import MEMORY_DB_PATH, CacheManager, CacheConfig
 from javinizer.models import MovieMetadata, Actress, Rating
 
 
-@pytest.fixture
-def temp_cache():
-    """Create a temporary cache for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = CacheConfig(
-            db_path=Path(tmpdir) / "test_cache.db",
-            ttl_days=7,
-            enabled=True,
+# Trusted literal built once without validation; tests get a deep copy
+_SAMPLE = MovieMetadata.model_construct(
+    id="IPX-486",
+    content_id="ipx00486",
+    title="Test Movie Title",
+    original_title="テスト映画",
+    description="Test description",
+    release_date=date(2024, 1, 15),
+    runtime=120,
+    maker="Test Studio",
+    actresses=[
+        Actress.model_construct(
+            first_name="Momo",
+            last_name="Sakura",
+            japanese_name="桜もも",
         )
-        cache = CacheManager(config)
-        yield cache
-        cache.close()
+    ],
+    genres=["Beautiful Girl", "Featured Actress"],
+    rating=Rating.model_construct(rating=8.5, votes=100),
+    cover_url="https://example.com/cover.jpg",
+    source="test",
+)
+
+
+@pytest.fixture(scope="module")
+def shared_cache():
+    """One in-memory cache database reused by every test in this module."""
+    config = CacheConfig(
+        db_path=Path(MEMORY_DB_PATH),
+        ttl_days=7,
+        enabled=True,
+        pragmas={"temp_store": "MEMORY", "cache_size": "-20000"},
+    )
+    cache = CacheManager(config)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def temp_cache(shared_cache):
+    """Empty cache for a single test.
+
+    CacheManager commits after every write, so tests are isolated by
+    clearing the shared database rather than rolling back a savepoint.
+    """
+    shared_cache.clear()
+    yield shared_cache
+    shared_cache.clear()
 
 
 @pytest.fixture
 def sample_metadata() -> MovieMetadata:
     """Sample metadata for testing."""
-    return MovieMetadata(
-        id="IPX-486",
-        content_id="ipx00486",
-        title="Test Movie Title",
-        original_title="テスト映画",
-        description="Test description",
-        release_date=date(2024, 1, 15),
-        runtime=120,
-        maker="Test Studio",
-        actresses=[
-            Actress(
-                first_name="Momo",
-                last_name="Sakura",
-                japanese_name="桜もも",
-            )
-        ],
-        genres=["Beautiful Girl", "Featured Actress"],
-        rating=Rating(rating=8.5, votes=100),
-        cover_url="https://example.com/cover.jpg",
-        source="test",
-    )
+    return _SAMPLE.model_copy(deep=True)
 
 
 class TestCacheConfig:
@@ -59,6 +75,7 @@ class TestCacheConfig:
         assert config.ttl_days == 30
         assert config.enabled is True
         assert config.max_entries == 0
+        assert config.pragmas == {}
 
     def test_custom_values(self):
         """Test custom configuration"""
@@ -104,11 +121,13 @@ class TestCacheManager:
     def test_different_sources_separate(self, temp_cache, sample_metadata):
         """Test that different sources are stored separately"""
         # Store with two sources
-        temp_cache.set("IPX-486", "dmm", sample_metadata)
-
-        modified = sample_metadata.model_copy()
-        modified.title = "Modified Title"
-        temp_cache.set("IPX-486", "r18dev", modified)
+        modified = sample_metadata.model_copy(update={"title": "Modified Title"})
+        temp_cache.set_many(
+            [
+                ("IPX-486", "dmm", sample_metadata),
+                ("IPX-486", "r18dev", modified),
+            ]
+        )
 
         # Retrieve both
         dmm_cached = temp_cache.get("IPX-486", "dmm")
@@ -119,8 +138,12 @@ class TestCacheManager:
 
     def test_invalidate_single_source(self, temp_cache, sample_metadata):
         """Test invalidating a specific source"""
-        temp_cache.set("IPX-486", "dmm", sample_metadata)
-        temp_cache.set("IPX-486", "r18dev", sample_metadata)
+        temp_cache.set_many(
+            [
+                ("IPX-486", "dmm", sample_metadata),
+                ("IPX-486", "r18dev", sample_metadata),
+            ]
+        )
 
         # Invalidate only dmm
         count = temp_cache.invalidate("IPX-486", "dmm")
@@ -132,8 +155,12 @@ class TestCacheManager:
 
     def test_invalidate_all_sources(self, temp_cache, sample_metadata):
         """Test invalidating all sources for a movie"""
-        temp_cache.set("IPX-486", "dmm", sample_metadata)
-        temp_cache.set("IPX-486", "r18dev", sample_metadata)
+        temp_cache.set_many(
+            [
+                ("IPX-486", "dmm", sample_metadata),
+                ("IPX-486", "r18dev", sample_metadata),
+            ]
+        )
 
         count = temp_cache.invalidate("IPX-486")
         assert count == 2
@@ -149,8 +176,12 @@ class TestCacheManager:
         assert stats["total_entries"] == 0
 
         # Add entries
-        temp_cache.set("IPX-486", "dmm", sample_metadata)
-        temp_cache.set("SSNI-123", "dmm", sample_metadata)
+        temp_cache.set_many(
+            [
+                ("IPX-486", "dmm", sample_metadata),
+                ("SSNI-123", "dmm", sample_metadata),
+            ]
+        )
 
         # Get to increment hit count
         temp_cache.get("IPX-486", "dmm")
@@ -161,8 +192,12 @@ class TestCacheManager:
 
     def test_clear(self, temp_cache, sample_metadata):
         """Test clearing all cache entries"""
-        temp_cache.set("IPX-486", "dmm", sample_metadata)
-        temp_cache.set("SSNI-123", "dmm", sample_metadata)
+        temp_cache.set_many(
+            [
+                ("IPX-486", "dmm", sample_metadata),
+                ("SSNI-123", "dmm", sample_metadata),
+            ]
+        )
 
         count = temp_cache.clear()
         assert count == 2
@@ -170,12 +205,70 @@ class TestCacheManager:
         stats = temp_cache.get_stats()
         assert stats["total_entries"] == 0
 
+    def test_set_many(self, temp_cache, sample_metadata):
+        """Test storing several entries in one transaction"""
+        count = temp_cache.set_many(
+            [
+                ("ipx-486", "dmm", sample_metadata),
+                ("SSNI-123", "r18dev", sample_metadata),
+            ]
+        )
+        assert count == 2
+
+        assert temp_cache.get("IPX-486", "dmm") is not None
+        assert temp_cache.get("SSNI-123", "r18dev") is not None
+
+    def test_set_many_empty(self, temp_cache):
+        """Test that an empty batch stores nothing"""
+        assert temp_cache.set_many([]) == 0
+        assert temp_cache.get_stats()["total_entries"] == 0
+
+    def test_pragmas_applied(self, tmp_path):
+        """Test that configured pragmas are applied on open"""
+        config = CacheConfig(
+            db_path=tmp_path / "test.db",
+            pragmas={"journal_mode": "WAL", "busy_timeout": "5000"},
+        )
+        with CacheManager(config) as cache:
+            assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert cache._conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_memory_database(self, temp_cache):
+        """Test that the in-memory database doesn't touch the filesystem"""
+        assert temp_cache.get_stats()["db_path"] == MEMORY_DB_PATH
+        assert not Path(MEMORY_DB_PATH).exists()
+
+    def test_invalid_pragma_rejected(self, tmp_path):
+        """Test that pragma values can't smuggle in extra SQL"""
+        config = CacheConfig(
+            db_path=tmp_path / "test.db",
+            pragmas={"journal_mode": "WAL; DROP TABLE metadata_cache"},
+        )
+        with pytest.raises(ValueError):
+            CacheManager(config)
+
+    def test_invalid_pragma_opens_no_connection(self, tmp_path, monkeypatch):
+        """Test that a bad pragma is rejected before a connection can leak"""
+        connects = []
+        monkeypatch.setattr(
+            "javinizer.cache.manager.sqlite3.connect",
+            lambda *args, **kwargs: connects.append(args),
+        )
+        config = CacheConfig(
+            db_path=tmp_path / "test.db",
+            pragmas={"cache_size": "-20000", "synchronous": "OFF; --"},
+        )
+        with pytest.raises(ValueError):
+            CacheManager(config)
+        assert connects == []
+
     def test_disabled_cache_returns_none(self, sample_metadata):
         """Test that disabled cache always returns None"""
         config = CacheConfig(enabled=False)
         cache = CacheManager(config)
 
         cache.set("IPX-486", "dmm", sample_metadata)
+        assert cache.set_many([("IPX-486", "dmm", sample_metadata)]) == 0
         result = cache.get("IPX-486", "dmm")
 
         assert result is None
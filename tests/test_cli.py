@@ -0,0 +1,143 @@
+"""CLI integration tests"""
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from javinizer.cli import main
+from javinizer.commands import sort as sort_commands
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create CLI test runner shared by the module"""
+    return CliRunner()
+
+
+HELP_COMMANDS = [
+    "find",
+    "sort",
+    "sort-dir",
+    "config",
+    "thumbs",
+    "update",
+    "update-dir",
+    "info",
+]
+
+
+@pytest.fixture(scope="module")
+def help_texts() -> dict[str, str]:
+    """Help text for the root group ("") and each command, rendered once"""
+    ctx = click.Context(main, info_name="javinizer")
+    texts = {"": main.get_help(ctx)}
+    for name in HELP_COMMANDS:
+        command = main.get_command(ctx, name)
+        assert command is not None, f"unknown command: {name}"
+        texts[name] = command.get_help(
+            click.Context(command, info_name=name, parent=ctx)
+        )
+    return texts
+
+
+class TestCLI:
+    """Test CLI commands"""
+
+    def test_main_help(self, help_texts):
+        """Test main help displays correctly"""
+        assert "Javinizer" in help_texts[""]
+
+    def test_version(self, runner):
+        """Test version option"""
+        result = runner.invoke(main, ["--version"], catch_exceptions=False)
+        assert result.exit_code == 0
+
+    def test_find_help(self, help_texts):
+        """Test find command help"""
+        assert "movie_id" in help_texts["find"].lower()
+
+    @pytest.mark.parametrize("command", HELP_COMMANDS)
+    def test_command_help(self, help_texts, command):
+        """Test that each command renders its help"""
+        assert help_texts[command].startswith(f"Usage: javinizer {command}")
+
+    def test_config_show(self, runner):
+        """Test config show command runs without error"""
+        result = runner.invoke(main, ["config", "show"], catch_exceptions=False)
+        # Should not crash, may have exit code 0 or show config
+        assert (
+            result.exit_code == 0
+            or "Configuration" in result.output
+            or "Config" in result.output
+        )
+
+
+class TestFindCommand:
+    """Test find command specifically"""
+
+    def test_find_missing_id_shows_error(self, runner):
+        """Test that find without ID shows error"""
+        result = runner.invoke(main, ["find"], catch_exceptions=False)
+        # Should fail because MOVIE_ID is required
+        assert (
+            result.exit_code != 0
+            or "Missing argument" in result.output
+            or "Usage" in result.output
+        )
+
+
+class TestConfigCommand:
+    """Test config commands"""
+
+    def test_set_proxy_no_args_shows_help(self, runner):
+        """Test set-proxy without args shows help message"""
+        result = runner.invoke(main, ["config", "set-proxy"], catch_exceptions=False)
+        # Should prompt user or show current state
+        assert result.exit_code == 0 or "Please provide" in result.output
+
+
+class TestSortDirCommand:
+    """Test sort-dir batch handling"""
+
+    @pytest.fixture
+    def video_dir(self, tmp_path):
+        """Directory with two sortable videos"""
+        for name in ("IPX-486.mp4", "ABP-420.mp4"):
+            (tmp_path / name).write_bytes(b"")
+        return tmp_path
+
+    def test_passes_extracted_ids(self, runner, video_dir, monkeypatch):
+        """Test each video is sorted with the ID extracted by the batch"""
+        sorted_ids = []
+        monkeypatch.setattr(
+            sort_commands,
+            "_sort_video",
+            lambda video, movie_id, *args, **kwargs: sorted_ids.append(movie_id),
+        )
+
+        result = runner.invoke(
+            main,
+            ["sort-dir", str(video_dir), "--dest", str(video_dir), "--min-size", "0"],
+        )
+
+        assert result.exit_code == 0
+        assert sorted(sorted_ids) == ["ABP-420", "IPX-486"]
+
+    def test_interrupt_prints_summary_and_aborts(
+        self, runner, video_dir, monkeypatch
+    ):
+        """Test Ctrl+C stops the batch, still summarizes, and exits non-zero"""
+
+        def interrupt(*args, **kwargs):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(sort_commands, "_sort_video", interrupt)
+
+        result = runner.invoke(
+            main,
+            ["sort-dir", str(video_dir), "--dest", str(video_dir), "--min-size", "0"],
+        )
+
+        assert result.exit_code != 0
+        assert "Summary:" in result.output
+        assert "Cancelled: 2" in result.output
@@ -28,66 +28,54 @@ class TestConcurrencyLimiter:
         with pytest.raises(ValueError):
             ConcurrencyLimiter(max_concurrent=-1)
 
-    def test_acquire_increments_count(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_acquire_increments_count(self):
         """Test that acquiring increments active count"""
+        limiter = ConcurrencyLimiter(max_concurrent=5)
 
-        async def run_test():
-            limiter = ConcurrencyLimiter(max_concurrent=5)
-
-            async with limiter.acquire():
-                assert limiter.active_count == 1
-
-            assert limiter.active_count == 0
+        async with limiter.acquire():
+            assert limiter.active_count == 1
 
-        asyncio.run(run_test())
+        assert limiter.active_count == 0
 
-    def test_total_count_increments(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_total_count_increments(self):
         """Test that total count tracks all operations"""
+        limiter = ConcurrencyLimiter(max_concurrent=5)
 
-        async def run_test():
-            limiter = ConcurrencyLimiter(max_concurrent=5)
-
-            for _ in range(3):
-                async with limiter.acquire():
-                    pass
-
-            assert limiter.total_count == 3
+        for _ in range(3):
+            async with limiter.acquire():
+                pass
 
-        asyncio.run(run_test())
+        assert limiter.total_count == 3
 
-    def test_limits_concurrency(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_limits_concurrency(self):
         """Test that concurrency is actually limited"""
+        limiter = ConcurrencyLimiter(max_concurrent=2)
+        max_observed = 0
 
-        async def run_test():
-            limiter = ConcurrencyLimiter(max_concurrent=2)
-            max_observed = 0
-
-            async def task():
-                nonlocal max_observed
-                async with limiter.acquire():
-                    max_observed = max(max_observed, limiter.active_count)
-                    await asyncio.sleep(0.05)
-
-            await asyncio.gather(*[task() for _ in range(5)])
+        async def task():
+            nonlocal max_observed
+            async with limiter.acquire():
+                max_observed = max(max_observed, limiter.active_count)
+                await asyncio.sleep(0.002)
 
-            assert max_observed <= 2
+        await asyncio.gather(*[task() for _ in range(20)])
 
-        asyncio.run(run_test())
+        assert max_observed <= 2
 
-    def test_reset_stats(self):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_reset_stats(self):
         """Test resetting statistics"""
+        limiter = ConcurrencyLimiter(max_concurrent=5)
 
-        async def run_test():
-            limiter = ConcurrencyLimiter(max_concurrent=5)
-
-            async with limiter.acquire():
-                pass
-
-            assert limiter.total_count == 1
-            limiter.reset_stats()
-            assert limiter.total_count == 0
+        async with limiter.acquire():
+            pass
 
-        asyncio.run(run_test())
+        assert limiter.total_count == 1
+        limiter.reset_stats()
+        assert limiter.total_count == 0
 
 
 class TestSyncConcurrencyLimiter:
@@ -123,9 +111,9 @@ class TestSyncConcurrencyLimiter:
             with limiter:
                 with lock:
                     max_observed = max(max_observed, limiter.active_count)
-                time.sleep(0.05)
+                time.sleep(0.002)
 
-        threads = [threading.Thread(target=task) for _ in range(5)]
+        threads = [threading.Thread(target=task) for _ in range(20)]
         for t in threads:
             t.start()
         for t in threads:
@@ -1,10 +1,13 @@
 """Tests for csv_utils module"""
 
 
+import os
+
 from javinizer.csv_utils import (
     CSVMapper,
     GenreMapper,
     StudioMapper,
+    get_genre_mapper,
     map_genres,
     map_studio,
 )
@@ -19,65 +22,67 @@ class TestCSVMapper:
         assert mapper.map("Test") == "Test"
         assert not mapper.is_loaded
 
-    def test_load_valid_csv(self, tmp_path):
+    def test_load_valid_csv(self):
         """Test loading valid CSV file"""
         csv_content = """Original,Replacement
 美少女,Beautiful Girl
 素人,Amateur"""
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = CSVMapper(csv_file)
+        mapper = CSVMapper.from_string(csv_content)
         assert mapper.is_loaded
         assert mapper.map("美少女") == "Beautiful Girl"
         assert mapper.map("素人") == "Amateur"
 
-    def test_case_insensitive(self, tmp_path):
+    def test_case_insensitive(self):
         """Test case-insensitive matching"""
         csv_content = "TEST,Replaced"
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = CSVMapper(csv_file)
+        mapper = CSVMapper.from_string(csv_content)
         assert mapper.map("TEST") == "Replaced"
         assert mapper.map("test") == "Replaced"
         assert mapper.map("Test") == "Replaced"
 
-    def test_filter_empty_replacement(self, tmp_path):
+    def test_filter_empty_replacement(self):
         """Test filtering items with empty replacement"""
         csv_content = """Original,Replacement
 Good,Nice
 Bad,"""
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = CSVMapper(csv_file)
+        mapper = CSVMapper.from_string(csv_content)
         assert mapper.map("Good") == "Nice"
         assert mapper.map("Bad") is None  # Filtered
 
-    def test_comment_lines_ignored(self, tmp_path):
+    def test_filter_wins_over_mapping(self):
+        """Test that a filter row beats a mapping for the same name"""
+        mapper = CSVMapper.from_string("Bad,\nBad,Good")
+        assert mapper.map("bad") is None
+        assert mapper.map_list(["Bad", "Other"]) == ["Other"]
+
+    def test_comment_lines_ignored(self):
         """Test that comment lines are ignored"""
         csv_content = """# This is a comment
 Original,Replacement
 #Another comment
 Test,Replaced"""
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = CSVMapper(csv_file)
+        mapper = CSVMapper.from_string(csv_content)
         assert mapper.map("Test") == "Replaced"
         assert mapper.map("# This is a comment") == "# This is a comment"
 
-    def test_map_list(self, tmp_path):
+    def test_quoted_multiline_field(self, tmp_path):
+        """Test that a quoted field may span lines"""
+        csv_content = '"a\nb",X\nFoo\x85Bar,Baz\n'
+        csv_file = tmp_path / "multiline.csv"
+        csv_file.write_text(csv_content, encoding="utf-8")
+
+        for mapper in (CSVMapper.from_string(csv_content), CSVMapper(csv_file)):
+            assert mapper.map("a\nb") == "X"
+            assert mapper.map("Foo\x85Bar") == "Baz"
+            assert mapper.filters == set()
+
+    def test_map_list(self):
         """Test mapping a list of values"""
         csv_content = """Original,Replacement
 A,Alpha
 B,
 C,Gamma"""
-        csv_file = tmp_path / "test.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = CSVMapper(csv_file)
+        mapper = CSVMapper.from_string(csv_content)
         result = mapper.map_list(["A", "B", "C", "D"])
         
         assert "Alpha" in result
@@ -95,26 +100,22 @@ C,Gamma"""
 class TestGenreMapper:
     """Tests for GenreMapper class"""
 
-    def test_genre_mapper_inherits_csvmapper(self, tmp_path):
+    def test_genre_mapper_inherits_csvmapper(self):
         """Test GenreMapper inherits from CSVMapper"""
         csv_content = "美少女,Beautiful Girl"
-        csv_file = tmp_path / "genres.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = GenreMapper(csv_file)
+        mapper = GenreMapper.from_string(csv_content)
+        assert isinstance(mapper, GenreMapper)
         assert mapper.map("美少女") == "Beautiful Girl"
 
 
 class TestStudioMapper:
     """Tests for StudioMapper class"""
 
-    def test_studio_mapper_inherits_csvmapper(self, tmp_path):
+    def test_studio_mapper_inherits_csvmapper(self):
         """Test StudioMapper inherits from CSVMapper"""
         csv_content = "S1 NO.1 STYLE,S1"
-        csv_file = tmp_path / "studios.csv"
-        csv_file.write_text(csv_content, encoding="utf-8")
-
-        mapper = StudioMapper(csv_file)
+        mapper = StudioMapper.from_string(csv_content)
+        assert isinstance(mapper, StudioMapper)
         assert mapper.map("S1 NO.1 STYLE") == "S1"
 
 
@@ -146,6 +147,27 @@ HD,"""
         assert map_studio("S1 NO.1 STYLE", csv_file) == "S1"
         assert map_studio("Other Studio", csv_file) == "Other Studio"
 
+    def test_mapper_cached_per_file(self, tmp_path):
+        """Test that repeated calls reuse the parsed CSV"""
+        csv_file = tmp_path / "genres.csv"
+        csv_file.write_text("美少女,Beautiful Girl", encoding="utf-8")
+
+        assert get_genre_mapper(csv_file) is get_genre_mapper(csv_file)
+
+    def test_mapper_reloaded_when_file_changes(self, tmp_path):
+        """Test that an edited CSV is parsed again"""
+        csv_file = tmp_path / "genres.csv"
+        csv_file.write_text("美少女,Beautiful Girl", encoding="utf-8")
+        assert map_genres(["美少女"], csv_file) == ["Beautiful Girl"]
+        before = csv_file.stat()
+
+        csv_file.write_text("美少女,Pretty Girl", encoding="utf-8")
+        # Same mtime, as when the rewrite lands within the mtime granularity;
+        # the size change alone must trigger a re-parse
+        os.utime(csv_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        assert map_genres(["美少女"], csv_file) == ["Pretty Girl"]
+
 
 class TestUTF8BOM:
     """Tests for UTF-8 BOM handling"""
@@ -0,0 +1,132 @@
+"""Tests for the FastAPI GUI application"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi.testclient import TestClient
+
+from javinizer.gui import app as gui_app
+from javinizer.models import MovieMetadata
+
+
+@pytest.fixture
+def client():
+    """Test client for a fresh GUI app"""
+    return TestClient(gui_app.create_app())
+
+
+@pytest.fixture
+def fake_scrape(monkeypatch):
+    """Replace network scraping with a canned single-source result"""
+    calls = []
+
+    def scrape_parallel(movie_id, sources, proxy_config, settings, console):
+        calls.append(movie_id)
+        return {
+            "r18dev": MovieMetadata(
+                id=movie_id,
+                title="Test Movie " * 50,
+                genres=["Drama", "Romance"],
+                source="r18dev",
+            )
+        }
+
+    monkeypatch.setattr(gui_app, "scrape_parallel", scrape_parallel)
+    return calls
+
+
+class TestCompression:
+    """Test response compression middleware"""
+
+    def test_large_response_is_gzipped(self, client, fake_scrape):
+        response = client.get("/api/find/ABC-123", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.json()["id"] == "ABC-123"
+
+    def test_small_response_not_compressed(self, client):
+        response = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json()["status"] == "ok"
+
+
+class TestFindCoalescing:
+    """Test that concurrent /api/find requests share one scrape"""
+
+    def test_concurrent_requests_scrape_once(self, monkeypatch):
+        calls = []
+
+        def slow_scrape(movie_id, sources, proxy_config, settings, console):
+            calls.append(movie_id)
+            time.sleep(0.1)
+            return {"r18dev": MovieMetadata(id=movie_id, title="Test", source="r18dev")}
+
+        monkeypatch.setattr(gui_app, "scrape_parallel", slow_scrape)
+        app = gui_app.create_app()
+
+        async def run_test():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await asyncio.gather(
+                    *(client.get("/api/find/ABC-123") for _ in range(5))
+                )
+
+        responses = asyncio.run(run_test())
+
+        assert all(r.status_code == 200 for r in responses)
+        assert calls == ["ABC-123"]
+
+    def test_id_casing_shares_one_scrape(self, monkeypatch):
+        calls = []
+
+        def slow_scrape(movie_id, sources, proxy_config, settings, console):
+            calls.append(movie_id)
+            time.sleep(0.1)
+            return {"r18dev": MovieMetadata(id=movie_id, title="Test", source="r18dev")}
+
+        monkeypatch.setattr(gui_app, "scrape_parallel", slow_scrape)
+        app = gui_app.create_app()
+
+        async def run_test():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await asyncio.gather(
+                    *(
+                        client.get(f"/api/find/{movie_id}")
+                        for movie_id in ("abc-123", "ABC-123")
+                    )
+                )
+
+        responses = asyncio.run(run_test())
+
+        assert [r.json()["id"] for r in responses] == ["ABC-123", "ABC-123"]
+        assert calls == ["ABC-123"]
+
+    def test_scrape_parallel_without_console(self):
+        # The GUI has no terminal, so scrape_parallel must accept console=None
+        assert gui_app.scrape_parallel("ABC-123", ["unknown"], None, None, None) == {}
+
+    def test_sequential_requests_scrape_again(self, client, fake_scrape):
+        client.get("/api/find/ABC-123")
+        client.get("/api/find/ABC-123")
+
+        assert fake_scrape == ["ABC-123", "ABC-123"]
+
+    def test_not_found(self, client, monkeypatch):
+        monkeypatch.setattr(gui_app, "scrape_parallel", lambda *args: {})
+
+        response = client.get("/api/find/ABC-123")
+
+        assert response.status_code == 404
@@ -4,15 +4,22 @@ These tests verify that components work together correctly.
 They use mocked network responses to avoid external dependencies.
 """
 
-from pathlib import Path
 from datetime import date
-from unittest.mock import Mock
-import tempfile
+from types import SimpleNamespace
+
+import pytest
 
 from javinizer.models import MovieMetadata, Actress, Settings
 from javinizer.aggregator import aggregate_metadata
 from javinizer.scrapers.r18dev import R18DevScraper
-from javinizer.exceptions import NetworkError, ScraperError
+from javinizer.exceptions import (
+    CloudflareError,
+    MovieNotFoundError,
+    NetworkError,
+    ParseError,
+    RateLimitError,
+    ScraperError,
+)
 
 
 class TestAggregatorIntegration:
@@ -74,6 +81,8 @@ class TestAggregatorIntegration:
         assert "HD" in aggregated.genres
         # Actresses should be merged (unique by japanese_name)
         assert len(aggregated.actresses) == 2
+        # The merged model skips re-validation, so check it would pass it
+        assert MovieMetadata.model_validate(aggregated.model_dump()) == aggregated
 
     def test_aggregate_single_source(self):
         """Test aggregation with single source returns that source's data."""
@@ -123,13 +132,13 @@ class TestScraperMocking:
 
         scraper = R18DevScraper()
 
-        # Create mock client and response
-        mock_response = Mock()
-        mock_response.json.return_value = mock_json
-        mock_response.status_code = 200
-
-        mock_client = Mock()
-        mock_client.get.return_value = mock_response
+        # Plain stubs for the client and response
+        mock_response = SimpleNamespace(
+            status_code=200,
+            json=lambda: mock_json,
+            raise_for_status=lambda: None,
+        )
+        mock_client = SimpleNamespace(get=lambda url, **kwargs: mock_response)
 
         # Directly set the private _client attribute
         scraper._client = mock_client
@@ -163,20 +172,13 @@ class TestExceptionHandling:
         assert error.url == "https://r18.dev/api/test"
         assert "Connection failed" in str(error)
 
-    def test_scraper_error_inheritance(self):
+    @pytest.mark.parametrize(
+        "exc",
+        [NetworkError, ParseError, RateLimitError, CloudflareError, MovieNotFoundError],
+    )
+    def test_scraper_error_inheritance(self, exc):
         """Test that all scraper errors inherit from ScraperError."""
-        from javinizer.exceptions import (
-            ParseError,
-            RateLimitError,
-            CloudflareError,
-            MovieNotFoundError,
-        )
-
-        assert issubclass(NetworkError, ScraperError)
-        assert issubclass(ParseError, ScraperError)
-        assert issubclass(RateLimitError, ScraperError)
-        assert issubclass(CloudflareError, ScraperError)
-        assert issubclass(MovieNotFoundError, ScraperError)
+        assert issubclass(exc, ScraperError)
 
 
 class TestSettingsValidation:
@@ -203,14 +205,10 @@ class TestSettingsValidation:
 class TestFileOperations:
     """Test file-related operations with temporary directories."""
 
-    def test_temp_directory_creation(self):
-        """Test that we can create and cleanup temp directories."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_file = Path(tmpdir) / "test.txt"
-            test_file.write_text("test content")
-
-            assert test_file.exists()
-            assert test_file.read_text() == "test content"
+    def test_temp_directory_creation(self, tmp_path):
+        """Test that we can write and read back files in a temp directory."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_text("test content")
 
-        # After context manager, temp dir should be cleaned up
-        assert not Path(tmpdir).exists()
+        assert test_file.exists()
+        assert test_file.read_text() == "test content"
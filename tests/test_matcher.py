@@ -1,7 +1,12 @@
 """Tests for javinizer.matcher module"""
 
 import pytest
-from javinizer.matcher import extract_movie_id, normalize_movie_id
+from javinizer.matcher import (
+    extract_movie_id,
+    extract_movie_ids,
+    find_video_files,
+    normalize_movie_id,
+)
 
 
 @pytest.mark.parametrize(
@@ -38,6 +43,8 @@ from javinizer.matcher import extract_movie_id, normalize_movie_id
         # T28 / Special
         ("T28-123.mp4", "T28-123"),
         ("S1-123.mp4", "S1-123"),
+        # Pattern precedence wins over position in the name
+        ("010123-123 FC2-PPV-123456.mp4", "FC2-PPV-123456"),
         # No match
         ("vacation_video.mp4", None),
         ("random_file.txt", None),
@@ -47,6 +54,18 @@ def test_extract_movie_id(filename, expected):
     assert extract_movie_id(filename) == expected
 
 
+def test_extract_movie_ids_matches_single_calls():
+    filenames = [
+        "IPX-486.mp4",
+        "vacation_video.mp4",
+        "FC2-PPV-123456.mp4",
+        "IPX-486.mp4",
+        "010123_123.mp4",
+    ]
+    assert extract_movie_ids(filenames) == [extract_movie_id(f) for f in filenames]
+    assert extract_movie_ids(iter([])) == []
+
+
 @pytest.mark.parametrize(
     "input_id, expected",
     [
@@ -59,3 +78,42 @@ def test_extract_movie_id(filename, expected):
 )
 def test_normalize_movie_id(input_id, expected):
     assert normalize_movie_id(input_id) == expected
+
+
+@pytest.fixture
+def video_tree(tmp_path):
+    """Directory with videos at two levels plus non-video files"""
+    (tmp_path / "ABC-123.mp4").write_bytes(b"x" * 10)
+    (tmp_path / "DEF-456.MKV").write_bytes(b"x" * 10)
+    (tmp_path / "notes.txt").write_text("not a video")
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "GHI-789.avi").write_bytes(b"x" * 10)
+    (sub / "fake.mp4").mkdir()
+    return tmp_path
+
+
+def test_find_video_files_top_level(video_tree):
+    videos = find_video_files(video_tree)
+    assert [p.name for p in videos] == ["ABC-123.mp4", "DEF-456.MKV"]
+
+
+def test_find_video_files_recursive(video_tree):
+    videos = find_video_files(video_tree, recursive=True)
+    assert videos == sorted(
+        [
+            video_tree / "ABC-123.mp4",
+            video_tree / "DEF-456.MKV",
+            video_tree / "sub" / "GHI-789.avi",
+        ]
+    )
+
+
+def test_find_video_files_min_size(video_tree):
+    (video_tree / "BIG-001.mp4").write_bytes(b"x" * (1024 * 1024))
+    videos = find_video_files(video_tree, min_size_mb=1)
+    assert [p.name for p in videos] == ["BIG-001.mp4"]
+
+
+def test_find_video_files_missing_dir(tmp_path):
+    assert find_video_files(tmp_path / "missing") == []
@@ -63,6 +63,14 @@ class TestMGStageScraper:
         movie_id = scraper._extract_id("", "/product/product_detail/SIRO-5000/")
         assert movie_id == "SIRO-5000"
 
+    def test_extract_id_from_unusual_url(self):
+        """Test ID extraction from URLs that miss the slicing fast path"""
+        scraper = MGStageScraper()
+
+        assert scraper._extract_id("", "/product/product_detail/siro-5000") == "SIRO-5000"
+        assert scraper._extract_id("", "/product/product_detail/SIRO-5000?x=1") == "SIRO-5000"
+        assert scraper._extract_id("", "/PRODUCT_DETAIL/SIRO-5000/") == "SIRO-5000"
+
     def test_extract_id_from_html(self):
         """Test ID extraction from HTML"""
         scraper = MGStageScraper()
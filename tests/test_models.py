@@ -1,6 +1,8 @@
 """Tests for javinizer.models module"""
 
-from javinizer.models import MovieMetadata
+import pytest
+
+from javinizer.models import Actress, MovieMetadata
 
 
 def test_movie_metadata_creation():
@@ -48,3 +50,30 @@ def test_movie_metadata_optional_fields():
     assert model.id == "IPX-486"
     assert model.actresses == []
     assert model.genres == []
+
+
+@pytest.mark.parametrize(
+    "fields, western, japanese_order",
+    [
+        ({"first_name": "Yua", "last_name": "Mikami"}, "Yua Mikami", "Mikami Yua"),
+        ({"first_name": "Yua"}, "Yua", "Yua"),
+        ({"last_name": "Mikami"}, "Mikami", "Mikami"),
+        ({"japanese_name": "三上悠亜"}, "三上悠亜", "三上悠亜"),
+        ({"first_name": "", "japanese_name": "三上悠亜"}, "三上悠亜", "三上悠亜"),
+        ({}, "Unknown", "Unknown"),
+    ],
+)
+def test_actress_names(fields, western, japanese_order):
+    actress = Actress(**fields)
+    assert actress.full_name == western
+    assert actress.full_name_japanese_order == japanese_order
+
+
+def test_source_and_genres_are_interned():
+    # Concatenate at runtime so the strings are distinct objects before validation
+    m, bang = "m", "!"
+    first = MovieMetadata(id="A-1", title="A", source="dm" + m, genres=["Drama" + bang])
+    second = MovieMetadata(id="B-2", title="B", source="dm" + m, genres=["Drama" + bang])
+
+    assert first.source is second.source
+    assert first.genres[0] is second.genres[0]
@@ -0,0 +1,27 @@
+"""Tests for nfo module"""
+
+from javinizer.nfo import escape_xml_chars
+
+
+class TestEscapeXmlChars:
+    """Tests for escape_xml_chars function"""
+
+    def test_escapes_markup_characters(self):
+        """Test &, < and > are escaped, & only once"""
+        assert escape_xml_chars("A & B <C>") == "A &amp; B &lt;C&gt;"
+        assert escape_xml_chars("&lt;") == "&amp;lt;"
+
+    def test_leaves_other_characters(self):
+        """Test slashes, quotes and Japanese text pass through unchanged"""
+        text = "桜もも / \"Momo\" 'Sakura'"
+        assert escape_xml_chars(text) == text
+
+    def test_clean_text_is_returned_as_is(self):
+        """Test text without markup characters is not copied"""
+        text = "Test Movie Title 2024"
+        assert escape_xml_chars(text) is text
+
+    def test_empty(self):
+        """Test empty and None input give an empty string"""
+        assert escape_xml_chars("") == ""
+        assert escape_xml_chars(None) == ""
@@ -36,6 +36,16 @@ class TestDomainRateLimiter:
         assert limiter._extract_domain("http://r18.dev/api/v1") == "r18.dev"
         assert limiter._extract_domain("https://Example.COM/") == "example.com"
 
+    def test_extract_domain_strips_extras(self):
+        """Test port, userinfo, query and fragment are not part of the domain"""
+        limiter = DomainRateLimiter()
+
+        assert limiter._extract_domain("http://localhost:8080/api") == "localhost"
+        assert limiter._extract_domain("https://user:pw@example.com/") == "example.com"
+        assert limiter._extract_domain("https://example.com?q=1") == "example.com"
+        assert limiter._extract_domain("https://example.com#top") == "example.com"
+        assert limiter._extract_domain("http://[::1]:8000/") == "::1"
+
     def test_get_delay_default(self):
         """Test getting default delay for unknown domain"""
         limiter = DomainRateLimiter(default_delay=1.5)
@@ -136,6 +146,21 @@ class TestDomainRateLimiter:
 
         assert len(errors) == 0
 
+    def test_waiting_domain_does_not_block_others(self):
+        """Test a domain waiting out its delay doesn't hold up other domains"""
+        limiter = DomainRateLimiter(default_delay=0.5)
+        limiter.acquire("https://slow.com/")
+
+        waiter = threading.Thread(target=limiter.acquire, args=("https://slow.com/",))
+        waiter.start()
+        time.sleep(0.05)  # Let the waiter start sleeping on slow.com
+
+        start = time.time()
+        assert limiter.acquire("https://fast.com/") == 0.0
+        assert time.time() - start < 0.1
+
+        waiter.join()
+
 
 class TestGlobalRateLimiter:
     """Test global rate limiter singleton"""
@@ -3,6 +3,8 @@
 from pathlib import Path
 from datetime import date
 
+import pytest
+
 from javinizer.scrapers.dmm import DMMScraper
 from javinizer.scrapers.r18dev import R18DevScraper
 
@@ -10,6 +12,20 @@ from javinizer.scrapers.r18dev import R18DevScraper
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(scope="module")
+def dmm_scraper():
+    """One DMMScraper shared by the parsing tests (no requests are made)"""
+    with DMMScraper() as scraper:
+        yield scraper
+
+
+@pytest.fixture(scope="module")
+def r18dev_scraper():
+    """One R18DevScraper shared by the parsing tests (no requests are made)"""
+    with R18DevScraper() as scraper:
+        yield scraper
+
+
 class TestDMMScraper:
     """Test DMM scraper parsing logic"""
 
@@ -30,52 +46,47 @@ class TestDMMScraper:
         # FC2 should be in variants
         assert any("fc2" in v.lower() for v in variants)
 
-    def test_normalize_id_returns_list(self):
-        """Test that get_id_variants returns a list"""
+    def test_normalize_id_returns_tuple(self):
+        """Test that get_id_variants returns an immutable tuple"""
         variants = DMMScraper.get_id_variants("SSNI-123")
-        assert isinstance(variants, list)
+        assert isinstance(variants, tuple)
         assert len(variants) > 0
 
-    def test_content_id_to_movie_id_basic(self):
+    def test_content_id_to_movie_id_basic(self, dmm_scraper):
         """Test conversion from DMM content ID to standard format"""
-        scraper = DMMScraper()
-        assert scraper._content_id_to_movie_id("ipx00486") == "IPX-486"
+        assert dmm_scraper._content_id_to_movie_id("ipx00486") == "IPX-486"
 
-    def test_content_id_to_movie_id_with_prefix(self):
+    def test_content_id_to_movie_id_with_prefix(self, dmm_scraper):
         """Test conversion with numeric prefix"""
-        scraper = DMMScraper()
         # The method should strip leading digits
-        result = scraper._content_id_to_movie_id("1ipx00486")
+        result = dmm_scraper._content_id_to_movie_id("1ipx00486")
         assert "IPX" in result.upper()
 
-    def test_get_search_url(self):
+    def test_get_search_url(self, dmm_scraper):
         """Test search URL generation"""
-        scraper = DMMScraper()
-        url = scraper.get_search_url("IPX-486")
+        url = dmm_scraper.get_search_url("IPX-486")
         assert "dmm.co.jp" in url
         assert "ipx" in url.lower() or "486" in url
 
-    def test_is_valid_actress_name_accepts_valid_names(self):
+    def test_is_valid_actress_name_accepts_valid_names(self, dmm_scraper):
         """Test that valid actress names are accepted"""
-        scraper = DMMScraper()
-        assert scraper._is_valid_actress_name("桃乃木かな") is True
-        assert scraper._is_valid_actress_name("Kana Momonogi") is True
-        assert scraper._is_valid_actress_name("明日花キララ") is True
+        assert dmm_scraper._is_valid_actress_name("桃乃木かな") is True
+        assert dmm_scraper._is_valid_actress_name("Kana Momonogi") is True
+        assert dmm_scraper._is_valid_actress_name("明日花キララ") is True
 
-    def test_is_valid_actress_name_rejects_promotional_text(self):
+    def test_is_valid_actress_name_rejects_promotional_text(self, dmm_scraper):
         """Test that promotional text is rejected"""
-        scraper = DMMScraper()
         # Reject promotional markers
         assert (
-            scraper._is_valid_actress_name(
+            dmm_scraper._is_valid_actress_name(
                 "★アダルトブック「桃乃木かな写真集」の商品ご購入はこちらから★"
             )
             is False
         )
         # Reject text with purchase links
-        assert scraper._is_valid_actress_name("商品ご購入はこちら") is False
+        assert dmm_scraper._is_valid_actress_name("商品ご購入はこちら") is False
         # Reject very long strings
-        assert scraper._is_valid_actress_name("A" * 50) is False
+        assert dmm_scraper._is_valid_actress_name("A" * 50) is False
 
 
 class TestR18DevScraper:
@@ -97,15 +108,13 @@ class TestR18DevScraper:
         assert result is not None
         assert isinstance(result, str)
 
-    def test_get_search_url(self):
+    def test_get_search_url(self, r18dev_scraper):
         """Test API URL generation"""
-        scraper = R18DevScraper()
-        url = scraper.get_search_url("IPX-486")
+        url = r18dev_scraper.get_search_url("IPX-486")
         assert "r18.dev" in url
 
-    def test_parse_actresses_from_json(self):
+    def test_parse_actresses_from_json(self, r18dev_scraper):
         """Test actress parsing from JSON response"""
-        scraper = R18DevScraper()
         # Mock data matches actual R18Dev API structure
         mock_data = {
             "actresses": [
@@ -116,21 +125,19 @@ class TestR18DevScraper:
                 }
             ]
         }
-        actresses = scraper._parse_actresses(mock_data)
+        actresses = r18dev_scraper._parse_actresses(mock_data)
         assert len(actresses) == 1
         assert actresses[0].japanese_name == "桜もも"
         assert actresses[0].first_name == "Momo"
         assert actresses[0].last_name == "Sakura"
 
-    def test_parse_actresses_empty(self):
+    def test_parse_actresses_empty(self, r18dev_scraper):
         """Test actress parsing with no actresses"""
-        scraper = R18DevScraper()
-        actresses = scraper._parse_actresses({})
+        actresses = r18dev_scraper._parse_actresses({})
         assert actresses == []
 
-    def test_parse_genres_from_json(self):
+    def test_parse_genres_from_json(self, r18dev_scraper):
         """Test genre parsing from categories"""
-        scraper = R18DevScraper()
         # Mock data matches actual R18Dev API structure
         mock_data = {
             "categories": [
@@ -138,55 +145,58 @@ class TestR18DevScraper:
                 {"name_en": "Featured Actress", "name_ja": "出演女優"},
             ]
         }
-        genres = scraper._parse_genres(mock_data)
+        genres = r18dev_scraper._parse_genres(mock_data)
         assert "Beautiful Girl" in genres
         assert "Featured Actress" in genres
 
-    def test_get_title_prefers_english(self):
+    def test_get_title_prefers_english(self, r18dev_scraper):
         """Test title extraction prefers English"""
-        scraper = R18DevScraper()
         mock_data = {"title": "English Title", "title_ja": "日本語タイトル"}
-        title = scraper._get_title(mock_data)
+        title = r18dev_scraper._get_title(mock_data)
         assert title == "English Title"
 
-    def test_get_title_fallback_to_japanese(self):
+    def test_get_title_fallback_to_japanese(self, r18dev_scraper):
         """Test title fallback to Japanese when English not available"""
-        scraper = R18DevScraper()
         mock_data = {"title": "", "title_ja": "日本語タイトル"}
-        title = scraper._get_title(mock_data)
+        title = r18dev_scraper._get_title(mock_data)
         assert title == "日本語タイトル"
 
-    def test_parse_date_valid(self):
+    def test_parse_date_valid(self, r18dev_scraper):
         """Test date parsing with valid date string"""
-        scraper = R18DevScraper()
-        result = scraper._parse_date("2024-01-15")
+        result = r18dev_scraper._parse_date("2024-01-15")
         assert result == date(2024, 1, 15)
 
-    def test_parse_date_invalid(self):
+    def test_parse_date_with_time(self, r18dev_scraper):
+        """Test date parsing ignores a trailing time component"""
+        assert r18dev_scraper._parse_date("2024-01-15 00:00:00") == date(2024, 1, 15)
+        assert r18dev_scraper._parse_date("2024-01-15T00:00:00Z") == date(2024, 1, 15)
+
+    def test_parse_date_unpadded(self, r18dev_scraper):
+        """Test date parsing still accepts unpadded month and day"""
+        assert r18dev_scraper._parse_date("2020-9-12") == date(2020, 9, 12)
+        assert r18dev_scraper._parse_date("2020-9-2 00:00:00") == date(2020, 9, 2)
+
+    def test_parse_date_invalid(self, r18dev_scraper):
         """Test date parsing with invalid input"""
-        scraper = R18DevScraper()
-        result = scraper._parse_date("not-a-date")
+        result = r18dev_scraper._parse_date("not-a-date")
         assert result is None
 
-    def test_parse_date_none(self):
+    def test_parse_date_none(self, r18dev_scraper):
         """Test date parsing with None input"""
-        scraper = R18DevScraper()
-        result = scraper._parse_date(None)
+        result = r18dev_scraper._parse_date(None)
         assert result is None
 
 
 class TestScraperBaseClass:
     """Test BaseScraper functionality"""
 
-    def test_dmm_scraper_has_name(self):
+    def test_dmm_scraper_has_name(self, dmm_scraper):
         """Test that DMMScraper has correct name"""
-        scraper = DMMScraper()
-        assert scraper.name == "dmm"
+        assert dmm_scraper.name == "dmm"
 
-    def test_r18dev_scraper_has_name(self):
+    def test_r18dev_scraper_has_name(self, r18dev_scraper):
         """Test that R18DevScraper has correct name"""
-        scraper = R18DevScraper()
-        assert scraper.name == "r18dev"
+        assert r18dev_scraper.name == "r18dev"
 
     def test_context_manager_closes_client(self):
         """Test that context manager closes client"""
@@ -196,10 +206,9 @@ class TestScraperBaseClass:
         # After exiting context, client should be closed (None)
         assert scraper._client is None
 
-    def test_verify_ssl_default_true(self):
+    def test_verify_ssl_default_true(self, dmm_scraper):
         """Test that SSL verification is enabled by default"""
-        scraper = DMMScraper()
-        assert scraper.verify_ssl is True
+        assert dmm_scraper.verify_ssl is True
 
     def test_verify_ssl_can_be_disabled(self):
         """Test that SSL verification can be disabled"""
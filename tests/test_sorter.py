@@ -3,12 +3,12 @@
 import pytest
 from pathlib import Path
 from datetime import date
-from javinizer.sorter import SortConfig, generate_sort_paths
+from javinizer.sorter import SortConfig, format_template, generate_sort_paths
 from javinizer.models import MovieMetadata, Actress
 
 
-@pytest.fixture
-def sample_metadata():
+@pytest.fixture(scope="module")
+def _metadata_template():
     return MovieMetadata(
         id="IPX-486",
         title="Test Movie Title 2024",
@@ -21,6 +21,12 @@ def sample_metadata():
     )
 
 
+@pytest.fixture
+def sample_metadata(_metadata_template):
+    # Tests mutate the metadata, so each one gets its own deep copy
+    return _metadata_template.model_copy(deep=True)
+
+
 @pytest.fixture
 def default_config():
     return SortConfig(
@@ -82,103 +88,64 @@ def test_generate_sort_paths_length_limit(sample_metadata, default_config):
     assert "AAAA" in folder_name
 
 
+def test_format_template_placeholders(sample_metadata, default_config):
+    # Known placeholders are filled; unknown ones keep their name once the
+    # invalid "<" and ">" are sanitized away
+    template = "<STUDIO>/<ID> <UNKNOWN> [<YEAR>]"
+    result = format_template(template, sample_metadata, default_config)
+    assert result == "IdeaPocket-IPX-486 UNKNOWN [2024]"
+    # Reusing the cached split gives the same result
+    assert format_template(template, sample_metadata, default_config) == result
+
+
 # ============================================================
 # Advanced Sorting Tests - Multi-level folder support
 # ============================================================
 
 
-class TestMultiLevelFolderSorting:
-    """Tests for output_folder multi-level folder structure"""
-
-    def test_output_folder_single_level(self, sample_metadata):
-        """Test single-level output folder (e.g., by actress)"""
-        config = SortConfig(
-            folder_format="<ID>",
-            output_folder=["<ACTORS>"],
-        )
-        video_path = Path("video.mp4")
-        dest_root = Path("/movies")
-
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
-
-        # Structure: /movies/Test Actress/IPX-486/
-        folder_parts = paths.folder_path.parts
-        assert "IPX-486" in folder_parts[-1]  # Movie folder
-        assert "Actress" in folder_parts[-2] or "Test" in folder_parts[-2]  # Actress folder
+def _parts(paths, dest_root):
+    """Folder components below the destination root"""
+    return paths.folder_path.relative_to(dest_root).parts
 
-    def test_output_folder_two_levels(self, sample_metadata):
-        """Test two-level output folder (e.g., actress + year)"""
-        config = SortConfig(
-            folder_format="<ID>",
-            output_folder=["<ACTORS>", "<YEAR>"],
-        )
-        video_path = Path("video.mp4")
-        dest_root = Path("/movies")
 
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
-
-        # Structure: /movies/<ACTORS>/<YEAR>/IPX-486/
-        folder_parts = paths.folder_path.parts
-        assert "IPX-486" in folder_parts[-1]  # Movie folder
-        assert "2024" in folder_parts[-2]  # Year folder
-
-    def test_output_folder_by_studio(self, sample_metadata):
-        """Test output folder by studio"""
-        config = SortConfig(
-            folder_format="<ID> - <TITLE>",
-            output_folder=["<STUDIO>"],
-        )
-        video_path = Path("video.mp4")
-        dest_root = Path("/movies")
-
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
-
-        # Structure: /movies/IdeaPocket/IPX-486 - Title/
-        folder_parts = paths.folder_path.parts
-        assert "IdeaPocket" in folder_parts[-2]
-
-    def test_output_folder_empty_list(self, sample_metadata):
-        """Test with empty output_folder (backward compatible)"""
-        config = SortConfig(
-            folder_format="<ID>",
-            output_folder=[],
-        )
-        video_path = Path("video.mp4")
-        dest_root = Path("/movies")
-
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
-
-        # Structure: /movies/IPX-486/ (flat, like before)
-        assert paths.folder_path.parent == dest_root
-        assert paths.folder_path.name == "IPX-486"
-
-    def test_output_folder_none_default(self, sample_metadata):
-        """Test default behavior (no output_folder)"""
-        config = SortConfig(
-            folder_format="<ID>",
-        )
-        video_path = Path("video.mp4")
-        dest_root = Path("/movies")
-
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
-
-        # Default should create flat structure
-        assert paths.folder_path.parent == dest_root
+class TestMultiLevelFolderSorting:
+    """Tests for output_folder multi-level folder structure"""
 
-    def test_output_folder_three_levels(self, sample_metadata):
-        """Test three-level nesting"""
-        config = SortConfig(
-            folder_format="<ID>",
-            output_folder=["<STUDIO>", "<ACTORS>", "<YEAR>"],
-        )
-        video_path = Path("video.mp4")
+    @pytest.mark.parametrize(
+        "config_kwargs, expected_parts",
+        [
+            # Single level, e.g. by actress
+            ({"output_folder": ["<ACTORS>"]}, ("Test Actress", "IPX-486")),
+            # Two levels: actress + year
+            (
+                {"output_folder": ["<ACTORS>", "<YEAR>"]},
+                ("Test Actress", "2024", "IPX-486"),
+            ),
+            # By studio
+            (
+                {"folder_format": "<ID> - <TITLE>", "output_folder": ["<STUDIO>"]},
+                ("IdeaPocket", "IPX-486 - Test Movie Title 2024"),
+            ),
+            # Three levels
+            (
+                {"output_folder": ["<STUDIO>", "<ACTORS>", "<YEAR>"]},
+                ("IdeaPocket", "Test Actress", "2024", "IPX-486"),
+            ),
+            # Empty list stays flat (backward compatible)
+            ({"output_folder": []}, ("IPX-486",)),
+            # Default (no output_folder) is flat too
+            ({}, ("IPX-486",)),
+        ],
+        ids=["single", "two_levels", "studio", "three_levels", "empty", "default"],
+    )
+    def test_output_folder_levels(self, sample_metadata, config_kwargs, expected_parts):
+        """Test output_folder levels nest between dest root and movie folder"""
+        config = SortConfig(**{"folder_format": "<ID>", **config_kwargs})
         dest_root = Path("/movies")
 
-        paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
+        paths = generate_sort_paths(Path("video.mp4"), dest_root, sample_metadata, config)
 
-        # Structure: /movies/<STUDIO>/<ACTORS>/<YEAR>/IPX-486/
-        folder_parts = paths.folder_path.parts
-        assert len(folder_parts) >= 4  # At least 4 levels deep
+        assert _parts(paths, dest_root) == expected_parts
 
     def test_output_folder_group_actress(self, sample_metadata):
         """Test group actress with multiple actresses"""
@@ -198,8 +165,7 @@ class TestMultiLevelFolderSorting:
         paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
 
         # Should use @Group for multiple actresses
-        folder_str = str(paths.folder_path)
-        assert "@Group" in folder_str
+        assert _parts(paths, dest_root) == ("@Group", "IPX-486")
 
     def test_output_folder_individual_actresses(self, sample_metadata):
         """Test listing all actresses (no grouping)"""
@@ -217,7 +183,6 @@ class TestMultiLevelFolderSorting:
 
         paths = generate_sort_paths(video_path, dest_root, sample_metadata, config)
 
-        folder_str = str(paths.folder_path)
         # Should contain actress names, not @Group
-        assert "@Group" not in folder_str
+        assert _parts(paths, dest_root) == ("Second Actress, Test Actress", "IPX-486")
 
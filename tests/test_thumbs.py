@@ -0,0 +1,22 @@
+"""Tests for thumbs module"""
+
+from javinizer import thumbs
+
+
+class TestGetActressDB:
+    """Tests for get_actress_db function"""
+
+    def test_returns_shared_instance(self, monkeypatch):
+        """Test the DB is constructed once and then reused"""
+        created = []
+
+        class FakeActressDB:
+            def __init__(self):
+                created.append(self)
+
+        monkeypatch.setattr(thumbs, "ActressDB", FakeActressDB)
+        monkeypatch.setattr(thumbs, "_global_actress_db", None)
+
+        first = thumbs.get_actress_db()
+        assert thumbs.get_actress_db() is first
+        assert len(created) == 1
@@ -5,6 +5,7 @@ from javinizer.scrapers.utils import (
     normalize_id_variants,
     normalize_id,
     content_id_to_movie_id,
+    is_japanese,
     is_valid_actress_name,
 )
 
@@ -86,6 +87,23 @@ class TestContentIdToMovieId:
         assert "ABC" in result or "abc" in result.lower()
 
 
+class TestIsJapanese:
+    """Test is_japanese function"""
+
+    def test_japanese_names(self):
+        """Test kana and kanji are detected"""
+        assert is_japanese("三上悠亜") is True
+        assert is_japanese("あいだ") is True
+        assert is_japanese("アイ") is True
+        assert is_japanese("Yua 三上") is True
+
+    def test_non_japanese_names(self):
+        """Test Latin text and symbols are not detected"""
+        assert is_japanese("Yua Mikami") is False
+        assert is_japanese("") is False
+        assert is_japanese("★—…") is False
+
+
 class TestIsValidActressName:
     """Test is_valid_actress_name function"""
 
@@ -114,6 +132,12 @@ class TestIsValidActressName:
         assert is_valid_actress_name("www.example.com") is False
         assert is_valid_actress_name("https://test.jp") is False
 
+    def test_width_variants_are_normalized(self):
+        """Test fullwidth and halfwidth forms are checked like their canonical form"""
+        assert is_valid_actress_name("ｗｗｗ．ｅｘａｍｐｌｅ．ｃｏｍ") is False
+        assert is_valid_actress_name("ｷｬﾝﾍﾟｰﾝ") is False
+        assert is_valid_actress_name("Ｍｏｍｏ Ｓａｋｕｒａ") is True
+
     def test_rejects_too_long(self):
         """Test rejection of overly long strings"""
         assert is_valid_actress_name("A" * 50) is False